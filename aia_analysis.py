@@ -6,10 +6,526 @@ Extracted from server.py to reduce complexity and improve code organization.
 """
 
 from typing import Dict, Any, List, Optional
+import copy
+import functools
+import itertools
 import logging
+import re
+
+from utils.term_scanner import build_term_scanner, scan_terms, scan_term_mask
 
 logger = logging.getLogger(__name__)
 
+# Public question categories mapped to the processor's internal categories
+_CATEGORY_MAP = {
+    "Project": "manual",
+    "System": "technical",
+    "Algorithm": "technical",
+    "Decision": "impact_risk",
+    "Impact": "impact_risk",
+    "Data": "technical",
+    "Consultations": "manual",
+    "De-risking": "manual"
+}
+
+# Internal question categories mapped to the display category shown to users
+_DISPLAY_CATEGORIES = {
+    'technical': 'System',  # Most technical questions are system-related
+    'impact_risk': 'Impact',
+    'manual': 'Project'
+}
+
+# Impact level number -> Roman numeral
+_ROMAN_NUMERALS = {1: 'I', 2: 'II', 3: 'III', 4: 'IV'}
+
+# Indicator -> description terms that set it (substring match on the
+# lowercased description). One table serves both analyses; each rule declares
+# the indicators it reads (see _RULE_INDICATORS) and only those are scanned.
+_INDICATOR_TERMS = {
+    'high_volume': ('thousands', 'millions', 'large scale', 'mass', 'bulk', 'daily', 'hourly', 'real-time', 'continuous'),
+    'personal_data': ('personal', 'private', 'confidential', 'sensitive', 'pii', 'credit', 'income', 'employment history', 'financial information'),
+    'financial': ('financial', 'money', 'payment', 'economic', 'benefit', 'tax', 'loan', 'credit', 'bank', 'mortgage', 'insurance'),
+    'health': ('health', 'medical', 'healthcare', 'patient', 'treatment', 'diagnosis', 'clinical'),
+    'employment': ('employment', 'hiring', 'job', 'recruitment', 'hr', 'resume', 'candidate'),
+    'law_enforcement': ('police', 'criminal', 'law enforcement', 'investigation', 'security', 'surveillance'),
+    'ai_ml': ('ai', 'artificial intelligence', 'machine learning', 'neural', 'deep learning', 'algorithm', 'model', 'trained'),
+    'automated_decision': ('automated', 'automatic', 'decision', 'approve', 'deny', 'reject', 'classify', 'determine', 'final decision', 'without human review'),
+    'third_party': ('third party', 'third-party', 'vendor', 'contractor', 'external', 'bureau', 'service'),
+    'public_facing': ('public', 'citizen', 'client', 'customer', 'user', 'applicant', 'individual'),
+    'government': ('government', 'federal', 'department', 'ministry', 'agency', 'public sector'),
+    'full_automation': ('without human review', 'automatically approve', 'automatically deny', 'final decision', 'no human intervention'),
+    'real_time': ('real-time', 'real time', 'immediate', 'instant', 'live'),
+    'high_impact_decisions': ('approve', 'deny', 'reject', 'grant', 'refuse', 'determine eligibility'),
+    # Functional preview only - simple_classification = classification and not decision_language
+    'classification': ('categorize', 'classify', 'sort', 'organize'),
+    'decision_language': ('approve', 'deny', 'reject', 'decision'),
+    'human_review': ('reviewed by', 'human staff', 'manual review', 'human oversight', 'staff review')
+}
+
+
+# Preliminary analysis recommendations by impact level (see
+# _generate_analysis_recommendations)
+_HIGH_RISK_RECOMMENDATIONS = (
+    "⚠️  HIGH RISK SYSTEM DETECTED - Requires qualified oversight",
+    "Implement comprehensive governance framework immediately",
+    "Conduct thorough bias testing and mitigation",
+    "Establish robust monitoring and audit trails",
+    "Plan for external validation and independent oversight"
+)
+_MODERATE_RISK_RECOMMENDATIONS = (
+    "Moderate risk system - Enhanced oversight required",
+    "Implement bias detection and mitigation measures",
+    "Establish clear audit trails and monitoring",
+    "Plan regular stakeholder consultations"
+)
+_LOWER_RISK_RECOMMENDATIONS = (
+    "Lower risk system - Standard procedures apply",
+    "Implement basic monitoring and documentation",
+    "Establish clear decision-making processes"
+)
+
+# (score threshold, recommendation) added when the score exceeds the threshold, in order
+_SCORE_RECOMMENDATIONS = (
+    (40, "Consider if this system truly needs to be fully automated"),
+    (25, "Implement human oversight for high-impact decisions")
+)
+
+# Functional previews kept per analyzer for repeat requests
+_FUNCTIONAL_PREVIEW_CACHE_SIZE = 128
+
+# System characteristics that add planning guidance (narrower term lists than
+# the risk indicators above)
+_GUIDANCE_INDICATOR_TERMS = {
+    'financial': ('financial', 'loan', 'credit', 'bank'),
+    'ai_ml': ('ai', 'machine learning', 'neural'),
+    'high_volume': ('thousands', 'daily', 'real-time'),
+    'automated': ('automated', 'without human review')
+}
+
+_GUIDANCE_TERM_SCANNER = build_term_scanner(_GUIDANCE_INDICATOR_TERMS)
+
+# One bit per indicator, including the derived simple_classification, for
+# the rules' decision tables (see _build_decision_table)
+_INDICATOR_BITS = {name: 1 << i for i, name in enumerate((*_INDICATOR_TERMS, 'simple_classification'))}
+
+# get_questions type=mitigation: questions whose title mentions mitigation measures
+_MITIGATION_TITLE_PATTERN = re.compile('mitigation|measure')
+
+# Sector questions: the title terms that make a question sector-specific, and
+# per sector the title terms, indicator and reasoning (automatic answer,
+# functional preview) the sector rules try, in order
+_SECTOR_TITLE_PATTERN = re.compile('health|economic|employment|law enforcement|licensing|social assistance')
+_FUNCTIONAL_SECTOR_TITLE_PATTERN = re.compile('health|economic|employment|law enforcement')
+_SECTOR_CHECKS = (
+    (('health',), 'health', "Health-related system identified", "Healthcare system clearly identified"),
+    (('economic', 'financial'), 'financial', "Financial/economic system identified", "Financial system clearly identified"),
+    (('employment',), 'employment', "Employment-related system identified", "Employment system clearly identified"),
+    (('law enforcement',), 'law_enforcement', "Law enforcement system identified", "Law enforcement system clearly identified")
+)
+
+
+def _sector_checks(title: str, functional: bool = False) -> tuple:
+    """(indicator, reasoning) pairs the sector rules try for a lowercased title."""
+    return tuple(
+        (indicator, functional_reasoning if functional else reasoning)
+        for terms, indicator, reasoning, functional_reasoning in _SECTOR_CHECKS
+        if any(term in title for term in terms)
+    )
+
+
+# Automatic-answer rules for _intelligent_project_analysis. Each takes the risk
+# indicators and the question's precomputed row and returns
+# (choice index, reasoning).
+
+def _answer_automation(indicators, row):
+    if indicators['full_automation'] or indicators['automated_decision']:
+        # Full automation - highest risk: last option
+        return row['last_index'], "Project description indicates full automation without human review"
+    return 0, "Partial automation with human oversight indicated"
+
+
+def _answer_impact(indicators, row):
+    if indicators['financial'] and indicators['high_impact_decisions']:
+        # Financial decisions with high impact: very high impact
+        return row['last_index'], "Financial decision system with significant economic impact on individuals"
+    if indicators['personal_data'] and indicators['automated_decision']:
+        return max(2, row['last_index'] - 1), "Automated decisions using personal data have high impact potential"
+    if indicators['public_facing']:
+        return 1, "Public-facing system has moderate impact potential"
+    return 0, "Limited impact indicators in project description"
+
+
+def _answer_reversible(indicators, row):
+    if indicators['financial'] and indicators['automated_decision']:
+        return row['last_index'] - 1, "Financial decisions are typically difficult to reverse"
+    if indicators['high_impact_decisions']:
+        return 1, "High-impact decisions usually have reversal processes"
+    return 0, "Standard decisions are typically reversible"
+
+
+def _answer_volume(indicators, row):
+    if indicators['high_volume']:
+        return row['last_index'], "Project description indicates high-volume processing"
+    return 0, "Standard volume processing indicated"
+
+
+def _answer_sector(indicators, row):
+    # (indicator, reasoning) pairs for the sectors named in the title, in order
+    for indicator, reasoning in row['sector_checks']:
+        if indicators[indicator]:
+            return 0, reasoning
+    return 1, "Sector not clearly indicated in description"
+
+
+def _answer_interpretability(indicators, row):
+    if indicators['ai_ml']:
+        return 0, "AI/ML systems are typically less interpretable"
+    return 1, "Rule-based system likely more interpretable"
+
+
+def _answer_learning(indicators, row):
+    if indicators['ai_ml']:
+        return 0, "Machine learning systems continue to evolve"
+    return 1, "Static rule-based system"
+
+
+def _answer_developer(indicators, row):
+    if indicators['third_party']:
+        # Third-party option, or the last option if there is none
+        index = row['third_party_index']
+        return (row['last_index'] if index is None else index), "Third-party development indicated in description"
+    return 0, "Internal development assumed"
+
+
+def _answer_personal_information(indicators, row):
+    if indicators['personal_data']:
+        return 0, "Personal information usage clearly indicated"
+    return 1, "No personal information usage indicated"
+
+
+def _answer_security_classification(indicators, row):
+    if indicators['financial'] or indicators['personal_data']:
+        # Protected A option, defaulting to the Protected A level
+        index = row['protected_a_index']
+        return (1 if index is None else index), "Financial/personal data typically requires Protected A classification"
+    return 0, "No sensitive data classification required"
+
+
+def _answer_public_scrutiny(indicators, row):
+    if indicators['financial'] or indicators['public_facing']:
+        return 0, "Financial/public-facing systems often subject to scrutiny"
+    return 1, "Limited public scrutiny expected"
+
+
+def _answer_fraud(indicators, row):
+    if indicators['financial'] or indicators['personal_data']:
+        return 0, "Financial/personal data systems are fraud targets"
+    return 1, "Limited fraud risk"
+
+
+def _answer_accountability(indicators, row):
+    # Assume proper governance
+    return 0, "Standard governance practices assumed"
+
+
+def _answer_alternative(indicators, row):
+    if indicators['full_automation']:
+        return 1, "Full automation may lack manual alternatives"
+    return 0, "Manual alternatives typically available"
+
+
+def _answer_protected_characteristics(indicators, row):
+    if indicators['ai_ml'] and (indicators['employment'] or indicators['financial']):
+        return 0, "AI systems in sensitive domains may inadvertently use protected characteristics"
+    return 1, "System designed to avoid protected characteristics"
+
+
+def _answer_recourse(indicators, row):
+    if indicators['high_impact_decisions']:
+        return 0, "High-impact systems typically have recourse processes"
+    return 1, "Limited recourse process"
+
+
+def _answer_monitoring(indicators, row):
+    if indicators['ai_ml'] or indicators['automated_decision']:
+        return 0, "Automated systems require performance monitoring"
+    return 1, "Limited monitoring for simple systems"
+
+
+def _answer_explainability(indicators, row):
+    if indicators['ai_ml']:
+        # AI systems often lack explainability
+        return 1, "AI/ML systems typically lack detailed explainability"
+    return 0, "Rule-based systems can provide explanations"
+
+
+def _classify_auto_answer_rule(title: str):
+    """Pick the automatic-answer rule for a lowercased question title (None for defaults)."""
+    # AUTOMATION TYPE QUESTIONS - Critical for scoring
+    if 'type of automation' in title or 'automation you are planning' in title:
+        return _answer_automation
+    # IMPACT QUESTIONS - Critical for high scores
+    if 'impact' in title and ('economic' in title or 'rights' in title or 'freedoms' in title):
+        return _answer_impact
+    # REVERSIBILITY QUESTIONS
+    if 'reversible' in title:
+        return _answer_reversible
+    # VOLUME AND FREQUENCY QUESTIONS
+    if 'frequency' in title or 'volume' in title or 'how many' in title:
+        return _answer_volume
+    # SECTOR-SPECIFIC QUESTIONS
+    if _SECTOR_TITLE_PATTERN.search(title):
+        return _answer_sector
+    # ALGORITHM COMPLEXITY AND INTERPRETABILITY
+    if 'algorithm' in title and ('interpret' in title or 'explain' in title or 'secret' in title):
+        return _answer_interpretability
+    if 'continue to learn' in title or 'evolve' in title:
+        return _answer_learning
+    # SYSTEM DEVELOPMENT QUESTIONS
+    if 'developed' in title:
+        return _answer_developer
+    # DATA AND PRIVACY QUESTIONS
+    if 'personal information' in title:
+        return _answer_personal_information
+    if 'security classification' in title:
+        return _answer_security_classification
+    # RISK PROFILE QUESTIONS
+    if 'public scrutiny' in title:
+        return _answer_public_scrutiny
+    if 'fraud' in title or 'exploitation' in title:
+        return _answer_fraud
+    # TECHNICAL SYSTEM QUESTIONS
+    if 'accountability' in title or 'assigned' in title:
+        return _answer_accountability
+    if 'alternative' in title and 'non-automated' in title:
+        return _answer_alternative
+    if 'protected characteristics' in title:
+        return _answer_protected_characteristics
+    # MITIGATION AND GOVERNANCE QUESTIONS
+    if 'recourse' in title or 'challenge' in title:
+        return _answer_recourse
+    if 'monitoring' in title and 'performance' in title:
+        return _answer_monitoring
+    if 'reasons' in title or 'explainable' in title:
+        return _answer_explainability
+    return None
+
+
+# Functional-preview rules for _functional_risk_analysis. Same shape as the
+# automatic-answer rules, except a rule returns None when the description
+# gives no clear evidence and the question is skipped.
+
+def _functional_automation(indicators, row):
+    if indicators['full_automation']:
+        return row['last_index'], "Full automation clearly stated - no human review mentioned"
+    if indicators['human_review']:
+        return 0, "Human review explicitly mentioned"
+    if indicators['automated_decision']:
+        # Mostly automated
+        return max(1, row['last_index'] - 1), "Automated decisions mentioned without explicit human review"
+    return None
+
+
+def _functional_economic_impact(indicators, row):
+    if indicators['financial'] and indicators['high_impact_decisions']:
+        return row['last_index'], "Financial decisions with clear economic consequences"
+    if indicators['financial']:
+        return max(1, row['last_index'] - 1), "Financial system with economic impact"
+    return None
+
+
+def _functional_rights_impact(indicators, row):
+    if indicators['financial'] and indicators['automated_decision']:
+        return row['last_index'], "Automated financial decisions impact individual rights"
+    if indicators['employment'] or indicators['health']:
+        return max(1, row['last_index'] - 1), "Employment/health system impacts individual rights"
+    return None
+
+
+def _functional_personal_information(indicators, row):
+    if indicators['personal_data']:
+        return 0, "Personal information usage explicitly mentioned"
+    if indicators['simple_classification']:
+        return 1, "Simple classification without personal data"
+    return None
+
+
+def _functional_interpretability(indicators, row):
+    if indicators['ai_ml']:
+        return 0, "AI/ML system mentioned - typically less interpretable"
+    if indicators['simple_classification']:
+        return 1, "Simple classification system - likely interpretable"
+    return None
+
+
+def _functional_learning(indicators, row):
+    if indicators['ai_ml']:
+        return 0, "Machine learning system mentioned"
+    if indicators['simple_classification']:
+        return 1, "Simple rule-based classification system"
+    return None
+
+
+def _functional_volume(indicators, row):
+    if indicators['high_volume']:
+        return row['last_index'], "High volume processing explicitly mentioned"
+    return None
+
+
+def _functional_sector(indicators, row):
+    for indicator, reasoning in row['sector_checks']:
+        if indicators[indicator]:
+            return 0, reasoning
+    return None
+
+
+def _functional_developer(indicators, row):
+    if indicators['third_party'] and row['third_party_index'] is not None:
+        return row['third_party_index'], "Third-party development explicitly mentioned"
+    return None
+
+
+def _functional_real_time(indicators, row):
+    if indicators['real_time']:
+        return 0, "Real-time processing explicitly mentioned"
+    return None
+
+
+def _classify_functional_rule(title: str):
+    """Pick the functional-preview rule for a lowercased question title (None to skip)."""
+    # Automation Type - Only if clearly stated
+    if 'type of automation' in title or 'automation you are planning' in title:
+        return _functional_automation
+    # Economic Impact - Only for clearly financial systems
+    if 'economic interests' in title and 'impact' in title:
+        return _functional_economic_impact
+    # Rights/Freedoms Impact - Only for high-impact systems
+    if 'rights or freedoms' in title and 'impact' in title:
+        return _functional_rights_impact
+    # Personal Information - Only if explicitly mentioned
+    if 'personal information' in title:
+        return _functional_personal_information
+    # Algorithm Interpretability - Only for AI/ML systems
+    if 'difficult to interpret' in title or 'explain' in title:
+        return _functional_interpretability
+    # Learning Algorithm - Only for AI/ML systems
+    if 'continue to learn' in title or 'evolve' in title:
+        return _functional_learning
+    # Volume/Frequency - Only if clearly stated
+    if 'frequency' in title or 'volume' in title or 'how many' in title:
+        return _functional_volume
+    # Sector-specific - Only if clearly in that sector
+    if _FUNCTIONAL_SECTOR_TITLE_PATTERN.search(title):
+        return _functional_sector
+    # Third-party development - Only if explicitly mentioned
+    if 'developed' in title:
+        return _functional_developer
+    # Real-time processing - Only if explicitly mentioned
+    if 'real-time' in title or 'immediate' in title:
+        return _functional_real_time
+    # Skip all other questions - don't make assumptions
+    return None
+
+
+# Indicators each rule reads. A rule's answer only depends on these (and on
+# its question's row), so it is evaluated once per combination of them.
+_RULE_INDICATORS = {
+    _answer_automation: ('full_automation', 'automated_decision'),
+    _answer_impact: ('financial', 'high_impact_decisions', 'personal_data', 'automated_decision', 'public_facing'),
+    _answer_reversible: ('financial', 'automated_decision', 'high_impact_decisions'),
+    _answer_volume: ('high_volume',),
+    _answer_sector: ('health', 'financial', 'employment', 'law_enforcement'),
+    _answer_interpretability: ('ai_ml',),
+    _answer_learning: ('ai_ml',),
+    _answer_developer: ('third_party',),
+    _answer_personal_information: ('personal_data',),
+    _answer_security_classification: ('financial', 'personal_data'),
+    _answer_public_scrutiny: ('financial', 'public_facing'),
+    _answer_fraud: ('financial', 'personal_data'),
+    _answer_accountability: (),
+    _answer_alternative: ('full_automation',),
+    _answer_protected_characteristics: ('ai_ml', 'employment', 'financial'),
+    _answer_recourse: ('high_impact_decisions',),
+    _answer_monitoring: ('ai_ml', 'automated_decision'),
+    _answer_explainability: ('ai_ml',),
+    _functional_automation: ('full_automation', 'human_review', 'automated_decision'),
+    _functional_economic_impact: ('financial', 'high_impact_decisions'),
+    _functional_rights_impact: ('financial', 'automated_decision', 'employment', 'health'),
+    _functional_personal_information: ('personal_data', 'simple_classification'),
+    _functional_interpretability: ('ai_ml', 'simple_classification'),
+    _functional_learning: ('ai_ml', 'simple_classification'),
+    _functional_volume: ('high_volume',),
+    _functional_sector: ('health', 'financial', 'employment', 'law_enforcement'),
+    _functional_developer: ('third_party',),
+    _functional_real_time: ('real_time',)
+}
+
+# Only indicators some rule reads are scanned for (classification and
+# decision_language feed simple_classification); the rest are never computed
+_SCANNED_INDICATOR_TERMS = {
+    name: terms for name, terms in _INDICATOR_TERMS.items()
+    if name in ('classification', 'decision_language')
+    or any(name in indicators for indicators in _RULE_INDICATORS.values())
+}
+_INDICATOR_SCANNER = build_term_scanner(_SCANNED_INDICATOR_TERMS, _INDICATOR_BITS)
+_CLASSIFICATION_BIT = _INDICATOR_BITS['classification']
+_DECISION_LANGUAGE_BIT = _INDICATOR_BITS['decision_language']
+_SIMPLE_CLASSIFICATION_BIT = _INDICATOR_BITS['simple_classification']
+
+
+def _build_decision_table(rule, row: Dict[str, Any], indicator_bits: Dict[str, int]) -> tuple:
+    """
+    Evaluate a rule for every combination of the indicators it reads.
+
+    Returns (rule_mask, table): the bits of those indicators, and the rule's
+    result keyed by indicator_mask & rule_mask, so answering a question is one
+    AND and one dict lookup.
+    """
+    relevant = _RULE_INDICATORS[rule]
+    table = {}
+    for flags in itertools.product((False, True), repeat=len(relevant)):
+        indicators = dict.fromkeys(indicator_bits, False)
+        key = 0
+        for name, flag in zip(relevant, flags):
+            if flag:
+                indicators[name] = True
+                key |= indicator_bits[name]
+        table[key] = rule(indicators, row)
+    return sum(indicator_bits[name] for name in relevant), table
+
+
+# Define critical questions that would significantly change the score
+_CRITICAL_GAP_PATTERNS = (
+    'policy or legal authority',
+    'bias testing',
+    'stakeholder consultation',
+    'impact assessment',
+    'protected characteristics'
+)
+_CRITICAL_GAP_PATTERN = re.compile('|'.join(map(re.escape, _CRITICAL_GAP_PATTERNS)))
+
+# Define important questions that affect compliance planning
+_IMPORTANT_GAP_PATTERNS = (
+    'oversight',
+    'appeal',
+    'monitoring',
+    'audit',
+    'training'
+)
+_IMPORTANT_GAP_PATTERN = re.compile('|'.join(map(re.escape, _IMPORTANT_GAP_PATTERNS)))
+
+
+def _gap_priority(question: Dict[str, Any], title: str) -> str:
+    """Gap priority of an unanswered question, from its lowercased title and max score."""
+    # Categorize based on question content and potential impact
+    if _CRITICAL_GAP_PATTERN.search(title):
+        return 'critical'
+    if _IMPORTANT_GAP_PATTERN.search(title):
+        return 'important'
+    if question.get('max_score', 0) > 2:  # High-scoring questions are important
+        return 'important'
+    return 'administrative'
+
 
 class AIAAnalyzer:
     """Intelligent analyzer for AIA assessments."""
@@ -19,6 +535,211 @@ class AIAAnalyzer:
         self.aia_processor = aia_processor
         self.description_validator = description_validator
 
+        # Display category per question name (see _get_question_category)
+        self._category_by_name = {}
+        for category, question_names in self.aia_processor.question_categories.items():
+            display_category = _DISPLAY_CATEGORIES.get(category)
+            if display_category:
+                for question_name in question_names:
+                    # First matching category wins, as in the original lookup order
+                    self._category_by_name.setdefault(question_name, display_category)
+
+        # The design-phase question set is fixed once the processor has loaded,
+        # so resolve it (and everything derived from it) once here
+        self._design_phase_questions = self._get_design_phase_questions()
+
+        # needsManualInput entry per design-phase question
+        self._manual_input_entries = {
+            question['name']: self._build_manual_input_entry(question)
+            for question in self._design_phase_questions
+        }
+
+        # Lowercased question titles for the keyword rules (built by the processor)
+        self._titles_lower = self.aia_processor.titles_lower
+
+        # get_questions results only depend on the (category, type) filter,
+        # so every combination is materialized once here
+        self._filtered_questions = self._build_question_filters()
+
+        # Per-question facts for automatic answering that only depend on the
+        # question's title and choices (see _build_auto_answer_row)
+        self._auto_answer_rows = [
+            self._build_auto_answer_row(question)
+            for question in self._design_phase_questions
+            if question.get('choices')
+        ]
+
+        # Scorable questions the functional preview can answer, with their
+        # rules (see _build_functional_row); all other questions are skipped
+        self._functional_rows = []
+        for question in self.aia_processor.scorable_questions:
+            if question.get('choices'):
+                row = self._build_functional_row(question)
+                if row['rule'] is not None:
+                    self._functional_rows.append(row)
+        # The functional responses depend only on the indicator bits some
+        # functional rule reads, so each combination of those is resolved
+        # once and the per-question loop and scoring are skipped on repeats
+        self._functional_answer_mask = 0
+        for row in self._functional_rows:
+            self._functional_answer_mask |= row['answer_mask']
+        self._cached_functional_responses = functools.lru_cache(maxsize=None)(self._functional_responses)
+
+        # (name, title, gap priority) per scorable question for _analyze_gaps
+        self._gap_rows = [
+            (question['name'], question['title'], _gap_priority(question, self._titles_lower[question['name']]))
+            for question in self.aia_processor.scorable_questions
+        ]
+
+        # Most recent functional previews by (name, description); the question
+        # set is fixed for the analyzer's lifetime, so entries never go stale
+        self._cached_functional_preview = functools.lru_cache(maxsize=_FUNCTIONAL_PREVIEW_CACHE_SIZE)(
+            self._build_functional_preview
+        )
+
+        # Invariant get_questions framework_info block (shared, treat as read-only)
+        self._framework_info = {
+            "name": "Canada's Algorithmic Impact Assessment (Design Phase)",
+            "total_questions": len(self.aia_processor.scorable_questions),
+            "max_possible_score": self.aia_processor.max_possible_score
+        }
+
+    def _build_manual_input_entry(self, question: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the needsManualInput entry for a question (shared, treat as read-only)."""
+        return {
+            'questionId': question['name'],
+            'question': question['title'],
+            'category': self._get_question_category(question['name']),
+            'type': 'risk' if question.get('max_score', 0) > 0 else 'mitigation',
+            'options': [{'text': choice['text'], 'score': choice['score']} for choice in question['choices']],
+            'reasoning': 'Could not be determined from project description - requires manual input'
+        }
+
+    @staticmethod
+    def _find_choice_index(question: Dict[str, Any], *fragments: str) -> Optional[int]:
+        """Index of the first choice whose text contains any fragment (case-insensitive)."""
+        for i, choice in enumerate(question['choices']):
+            text_lower = choice['text'].lower()
+            if any(fragment in text_lower for fragment in fragments):
+                return i
+        return None
+
+    def _build_auto_answer_row(self, question: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute everything _intelligent_project_analysis needs for a question
+        that does not depend on the project description.
+
+        The row holds the question, its automatic-answer rule (None when only the
+        defaults apply), the default answer, and the choice indices and sector
+        checks the rules read; third_party_index and protected_a_index are None
+        when no choice matches. The rule is then evaluated for every indicator
+        combination it reads: 'answers' maps risk indicator mask & 'answer_mask'
+        to the finished response (shared, treat as read-only).
+        """
+        choices = question['choices']
+        title = self._titles_lower[question['name']]
+        # DEFAULT HANDLING - More nuanced defaults
+        if len(choices) == 2:
+            # If it's a risk question (higher score for "yes"), default to moderate risk
+            if choices[0]['score'] > choices[1]['score']:
+                default_index = 1  # Lower risk option
+            else:
+                default_index = 0  # Standard option
+            default_reasoning = "Conservative default response"
+        else:
+            # For multi-choice, default to second option (moderate)
+            default_index = min(1, len(choices) - 1)
+            default_reasoning = "Moderate default response based on limited information"
+
+        row = {
+            'question': question,
+            'rule': _classify_auto_answer_rule(title),
+            'last_index': len(choices) - 1,
+            'default_index': default_index,
+            'default_reasoning': default_reasoning,
+            'third_party_index': self._find_choice_index(question, 'third party', 'non-government'),
+            'protected_a_index': self._find_choice_index(question, 'protected a'),
+            'sector_checks': _sector_checks(title)
+        }
+        if row['rule'] is None:
+            # DEFAULT HANDLING - the same answer for every description
+            row['answer_mask'], results = 0, {0: (default_index, default_reasoning)}
+        else:
+            row['answer_mask'], results = _build_decision_table(row['rule'], row, _INDICATOR_BITS)
+        row['answers'] = {}
+        for key, (selected_choice_index, reasoning) in results.items():
+            # Ensure index is valid
+            selected_choice = choices[max(0, min(selected_choice_index, row['last_index']))]
+            row['answers'][key] = {
+                'question_id': question['name'],
+                'selected_values': [selected_choice['value']],
+                'reasoning': reasoning,
+                'confidence': 0.8 if "clearly indicated" in reasoning or "identified" in reasoning else 0.6
+            }
+        return row
+
+    def _build_functional_row(self, question: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute what _functional_risk_analysis needs for a question (see _build_auto_answer_row)."""
+        title = self._titles_lower[question['name']]
+        row = {
+            'question': question,
+            'rule': _classify_functional_rule(title),
+            'last_index': len(question['choices']) - 1,
+            'third_party_index': self._find_choice_index(question, 'third party', 'non-government'),
+            'sector_checks': _sector_checks(title, functional=True)
+        }
+        if row['rule'] is None:
+            # Never answered - the caller drops the row
+            return row
+        row['answer_mask'], results = _build_decision_table(row['rule'], row, _INDICATOR_BITS)
+        row['answers'] = {}
+        for key, answer in results.items():
+            if answer is None:
+                # No clear evidence - skip the question
+                row['answers'][key] = None
+                continue
+            selected_choice_index, reasoning = answer
+            # Ensure index is valid
+            selected_choice = question['choices'][max(0, min(selected_choice_index, row['last_index']))]
+            row['answers'][key] = {
+                'question_id': question['name'],
+                'selected_values': [selected_choice['value']],
+                'reasoning': reasoning,
+                'confidence': 0.9,  # High confidence since we only answer with clear evidence
+                'is_functional': True
+            }
+        return row
+
+    def _build_question_filters(self) -> Dict[tuple, tuple]:
+        """
+        Precompute get_questions results keyed by (internal category, question type).
+
+        Each value is (first 20 questions, total matching questions).
+        """
+        design_phase_questions = self._design_phase_questions
+        questions_by_name = self.aia_processor.questions_by_name
+
+        questions_by_category = {None: design_phase_questions}
+        for internal_category in set(_CATEGORY_MAP.values()):
+            category_questions = self.aia_processor.question_categories.get(internal_category, [])
+            questions_by_category[internal_category] = [
+                questions_by_name[name] for name in category_questions if name in questions_by_name
+            ]
+
+        filtered_questions = {}
+        for internal_category, questions in questions_by_category.items():
+            by_type = {
+                None: questions,
+                # Questions that contribute to risk scoring
+                "risk": [q for q in questions if q.get('max_score', 0) > 0],
+                # Questions about mitigation measures
+                "mitigation": [q for q in questions if _MITIGATION_TITLE_PATTERN.search(self._titles_lower[q['name']])]
+            }
+            for question_type, typed_questions in by_type.items():
+                # Limit to first 20 questions
+                filtered_questions[(internal_category, question_type)] = (typed_questions[:20], len(typed_questions))
+        return filtered_questions
+
     def _analyze_project_description(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle project description analysis requests with intelligent automatic scoring."""
         # WORKFLOW ENFORCEMENT (introduction gate) is checked by the caller (server.py)
@@ -26,11 +747,11 @@ class AIAAnalyzer:
         project_name = arguments.get("projectName", "")
         project_description = arguments.get("projectDescription", "")
 
-        logger.info(f"Analyzing project description: {project_name}")
+        logger.info("Analyzing project description: %s", project_name)
         
         # Get Design phase questions for all calculations
-        design_phase_questions = self._get_design_phase_questions()
-        design_phase_max_score = sum(q['max_score'] for q in design_phase_questions)
+        design_phase_questions = self._design_phase_questions
+        design_phase_max_score = self.aia_processor.max_possible_score
         
         # Perform intelligent analysis of the project description
         auto_responses = self._intelligent_project_analysis(project_description)
@@ -41,12 +762,16 @@ class AIAAnalyzer:
         
         # Get questions that still need manual input (Design phase only)
         answered_question_ids = {r['question_id'] for r in auto_responses}
-        questions_by_name = {q['name']: q for q in design_phase_questions}
+        questions_by_name = self.aia_processor.questions_by_name
+        choice_index = self.aia_processor.choice_index
         
+        # Only the first 18 unanswered questions are reported, so stop there
         manual_questions = []
         for question in design_phase_questions:
             if question['name'] not in answered_question_ids:
                 manual_questions.append(question)
+                if len(manual_questions) == 18:
+                    break
         
         # Get auto-answered questions with reasoning
         auto_answered_questions = []
@@ -57,11 +782,7 @@ class AIAAnalyzer:
                 selected_value = response['selected_values'][0]
                 
                 # Find the selected choice
-                selected_choice = None
-                for choice in question['choices']:
-                    if choice['value'] == selected_value:
-                        selected_choice = choice
-                        break
+                _, selected_choice = choice_index[question_id].get(selected_value, (0, None))
                 
                 if selected_choice:
                     auto_answered_questions.append({
@@ -81,13 +802,7 @@ class AIAAnalyzer:
                 selected_value = response['selected_values'][0]
                 
                 # Find the selected choice and its index
-                selected_choice = None
-                selected_option = 0
-                for i, choice in enumerate(question['choices']):
-                    if choice['value'] == selected_value:
-                        selected_choice = choice
-                        selected_option = i
-                        break
+                selected_option, selected_choice = choice_index[question_id].get(selected_value, (0, None))
                 
                 if selected_choice:
                     auto_answered_formatted.append({
@@ -101,15 +816,8 @@ class AIAAnalyzer:
         
         # Format manual input questions
         needs_manual_input = []
-        for question in manual_questions[:18]:  # Limit to 18 questions
-            needs_manual_input.append({
-                'questionId': question['name'],
-                'question': question['title'],
-                'category': self._get_question_category(question['name']),
-                'type': 'risk' if question.get('max_score', 0) > 0 else 'mitigation',
-                'options': [{'text': choice['text'], 'score': choice['score']} for choice in question['choices']],
-                'reasoning': 'Could not be determined from project description - requires manual input'
-            })
+        for question in manual_questions:  # Limited to 18 questions above
+            needs_manual_input.append(dict(self._manual_input_entries[question['name']]))
         
         # Calculate percentages using Design phase questions
         completion_percentage = round((len(auto_responses) / len(design_phase_questions)) * 100)
@@ -134,290 +842,36 @@ class AIAAnalyzer:
 
     def _intelligent_project_analysis(self, project_description: str) -> List[Dict[str, Any]]:
         """Perform intelligent analysis of project description to automatically answer questions."""
-        auto_responses = []
-        description_lower = project_description.lower()
-        
-        # Enhanced risk indicators with more comprehensive pattern matching
-        risk_indicators = {
-            'high_volume': any(term in description_lower for term in ['thousands', 'millions', 'large scale', 'mass', 'bulk', 'daily', 'hourly', 'real-time', 'continuous']),
-            'personal_data': any(term in description_lower for term in ['personal', 'private', 'confidential', 'sensitive', 'pii', 'credit', 'income', 'employment history', 'financial information']),
-            'financial': any(term in description_lower for term in ['financial', 'money', 'payment', 'economic', 'benefit', 'tax', 'loan', 'credit', 'bank', 'mortgage', 'insurance']),
-            'health': any(term in description_lower for term in ['health', 'medical', 'healthcare', 'patient', 'treatment', 'diagnosis', 'clinical']),
-            'employment': any(term in description_lower for term in ['employment', 'hiring', 'job', 'recruitment', 'hr', 'resume', 'candidate']),
-            'law_enforcement': any(term in description_lower for term in ['police', 'criminal', 'law enforcement', 'investigation', 'security', 'surveillance']),
-            'ai_ml': any(term in description_lower for term in ['ai', 'artificial intelligence', 'machine learning', 'neural', 'deep learning', 'algorithm', 'model', 'trained']),
-            'automated_decision': any(term in description_lower for term in ['automated', 'automatic', 'decision', 'approve', 'deny', 'reject', 'classify', 'determine', 'final decision', 'without human review']),
-            'third_party': any(term in description_lower for term in ['third party', 'third-party', 'vendor', 'contractor', 'external', 'bureau', 'service']),
-            'public_facing': any(term in description_lower for term in ['public', 'citizen', 'client', 'customer', 'user', 'applicant', 'individual']),
-            'government': any(term in description_lower for term in ['government', 'federal', 'department', 'ministry', 'agency', 'public sector']),
-            'full_automation': any(term in description_lower for term in ['without human review', 'automatically approve', 'automatically deny', 'final decision', 'no human intervention']),
-            'real_time': any(term in description_lower for term in ['real-time', 'real time', 'immediate', 'instant', 'live']),
-            'high_impact_decisions': any(term in description_lower for term in ['approve', 'deny', 'reject', 'grant', 'refuse', 'determine eligibility'])
-        }
-        
-        # Filter questions to only include those visible in Design phase
-        # Based on survey-enfr.json analysis: Design phase users see questions that are either:
-        # 1. Always visible (no visibleIf condition), OR
-        # 2. Have visibleIf condition "{projectDetailsPhase} = \"item1\"" (Design phase)
-        design_phase_questions = self._get_design_phase_questions()
-        
-        # Get questions by name for lookup
-        questions_by_name = {q['name']: q for q in design_phase_questions}
+        if project_description.strip():
+            # Enhanced risk indicators with more comprehensive pattern matching -
+            # one scan of the description finds every indicator term
+            indicator_mask = scan_term_mask(project_description.lower(), _INDICATOR_SCANNER)
+        else:
+            indicator_mask = 0
         
-        # Automatically answer questions based on comprehensive project analysis
-        for question in design_phase_questions:
-            question_name = question['name']
-            question_title = question['title'].lower()
-            
-            # Skip if no choices available
-            if not question.get('choices'):
-                continue
-            
-            selected_choice_index = None
-            reasoning = ""
-            
-            # AUTOMATION TYPE QUESTIONS - Critical for scoring
-            if 'type of automation' in question_title or 'automation you are planning' in question_title:
-                if risk_indicators['full_automation'] or risk_indicators['automated_decision']:
-                    # Full automation - highest risk
-                    selected_choice_index = len(question['choices']) - 1  # Last option (full automation)
-                    reasoning = "Project description indicates full automation without human review"
-                else:
-                    selected_choice_index = 0  # Partial automation
-                    reasoning = "Partial automation with human oversight indicated"
-            
-            # IMPACT QUESTIONS - Critical for high scores
-            elif 'impact' in question_title and ('economic' in question_title or 'rights' in question_title or 'freedoms' in question_title):
-                if risk_indicators['financial'] and risk_indicators['high_impact_decisions']:
-                    # Financial decisions with high impact
-                    selected_choice_index = len(question['choices']) - 1  # Very high impact
-                    reasoning = "Financial decision system with significant economic impact on individuals"
-                elif risk_indicators['personal_data'] and risk_indicators['automated_decision']:
-                    selected_choice_index = max(2, len(question['choices']) - 2)  # High impact
-                    reasoning = "Automated decisions using personal data have high impact potential"
-                elif risk_indicators['public_facing']:
-                    selected_choice_index = 1  # Moderate impact
-                    reasoning = "Public-facing system has moderate impact potential"
-                else:
-                    selected_choice_index = 0  # Low impact
-                    reasoning = "Limited impact indicators in project description"
-            
-            # REVERSIBILITY QUESTIONS
-            elif 'reversible' in question_title:
-                if risk_indicators['financial'] and risk_indicators['automated_decision']:
-                    selected_choice_index = len(question['choices']) - 2  # Difficult to reverse
-                    reasoning = "Financial decisions are typically difficult to reverse"
-                elif risk_indicators['high_impact_decisions']:
-                    selected_choice_index = 1  # Likely reversible
-                    reasoning = "High-impact decisions usually have reversal processes"
-                else:
-                    selected_choice_index = 0  # Reversible
-                    reasoning = "Standard decisions are typically reversible"
-            
-            # VOLUME AND FREQUENCY QUESTIONS
-            elif 'frequency' in question_title or 'volume' in question_title or 'how many' in question_title:
-                if risk_indicators['high_volume']:
-                    selected_choice_index = len(question['choices']) - 1  # Highest volume option
-                    reasoning = "Project description indicates high-volume processing"
-                else:
-                    selected_choice_index = 0  # Lower volume
-                    reasoning = "Standard volume processing indicated"
-            
-            # SECTOR-SPECIFIC QUESTIONS
-            elif any(sector in question_title for sector in ['health', 'economic', 'employment', 'law enforcement', 'licensing', 'social assistance']):
-                if risk_indicators['health'] and 'health' in question_title:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Health-related system identified"
-                elif risk_indicators['financial'] and ('economic' in question_title or 'financial' in question_title):
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Financial/economic system identified"
-                elif risk_indicators['employment'] and 'employment' in question_title:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Employment-related system identified"
-                elif risk_indicators['law_enforcement'] and 'law enforcement' in question_title:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Law enforcement system identified"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "Sector not clearly indicated in description"
-            
-            # ALGORITHM COMPLEXITY AND INTERPRETABILITY
-            elif 'algorithm' in question_title and ('interpret' in question_title or 'explain' in question_title or 'secret' in question_title):
-                if risk_indicators['ai_ml']:
-                    selected_choice_index = 0  # Yes - difficult to interpret
-                    reasoning = "AI/ML systems are typically less interpretable"
-                else:
-                    selected_choice_index = 1  # No - interpretable
-                    reasoning = "Rule-based system likely more interpretable"
-            
-            elif 'continue to learn' in question_title or 'evolve' in question_title:
-                if risk_indicators['ai_ml']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Machine learning systems continue to evolve"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "Static rule-based system"
-            
-            # SYSTEM DEVELOPMENT QUESTIONS
-            elif 'developed' in question_title or 'who developed' in question_title:
-                if risk_indicators['third_party']:
-                    # Find third-party option
-                    for i, choice in enumerate(question['choices']):
-                        if 'third party' in choice['text'].lower() or 'non-government' in choice['text'].lower():
-                            selected_choice_index = i
-                            break
-                    if selected_choice_index is None:
-                        selected_choice_index = len(question['choices']) - 1
-                    reasoning = "Third-party development indicated in description"
-                else:
-                    selected_choice_index = 0  # Internal development
-                    reasoning = "Internal development assumed"
-            
-            # DATA AND PRIVACY QUESTIONS
-            elif 'personal information' in question_title:
-                if risk_indicators['personal_data']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Personal information usage clearly indicated"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "No personal information usage indicated"
-            
-            elif 'security classification' in question_title:
-                if risk_indicators['financial'] or risk_indicators['personal_data']:
-                    # Find Protected A or higher
-                    for i, choice in enumerate(question['choices']):
-                        if 'protected a' in choice['text'].lower():
-                            selected_choice_index = i
-                            break
-                    if selected_choice_index is None:
-                        selected_choice_index = 1  # Default to Protected A level
-                    reasoning = "Financial/personal data typically requires Protected A classification"
-                else:
-                    selected_choice_index = 0  # None
-                    reasoning = "No sensitive data classification required"
-            
-            # RISK PROFILE QUESTIONS
-            elif 'public scrutiny' in question_title:
-                if risk_indicators['financial'] or risk_indicators['public_facing']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Financial/public-facing systems often subject to scrutiny"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "Limited public scrutiny expected"
-            
-            elif 'fraud' in question_title or 'exploitation' in question_title:
-                if risk_indicators['financial'] or risk_indicators['personal_data']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Financial/personal data systems are fraud targets"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "Limited fraud risk"
-            
-            # TECHNICAL SYSTEM QUESTIONS
-            elif 'accountability' in question_title or 'assigned' in question_title:
-                selected_choice_index = 0  # Yes - assume proper governance
-                reasoning = "Standard governance practices assumed"
-            
-            elif 'alternative' in question_title and 'non-automated' in question_title:
-                if risk_indicators['full_automation']:
-                    selected_choice_index = 1  # No alternative
-                    reasoning = "Full automation may lack manual alternatives"
-                else:
-                    selected_choice_index = 0  # Yes - alternative available
-                    reasoning = "Manual alternatives typically available"
-            
-            elif 'protected characteristics' in question_title:
-                if risk_indicators['ai_ml'] and (risk_indicators['employment'] or risk_indicators['financial']):
-                    selected_choice_index = 0  # Yes - may consider protected characteristics
-                    reasoning = "AI systems in sensitive domains may inadvertently use protected characteristics"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "System designed to avoid protected characteristics"
-            
-            # MITIGATION AND GOVERNANCE QUESTIONS
-            elif 'recourse' in question_title or 'challenge' in question_title:
-                if risk_indicators['high_impact_decisions']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "High-impact systems typically have recourse processes"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "Limited recourse process"
-            
-            elif 'monitoring' in question_title and 'performance' in question_title:
-                if risk_indicators['ai_ml'] or risk_indicators['automated_decision']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Automated systems require performance monitoring"
-                else:
-                    selected_choice_index = 1  # No
-                    reasoning = "Limited monitoring for simple systems"
-            
-            elif 'reasons' in question_title or 'explainable' in question_title:
-                if risk_indicators['ai_ml']:
-                    selected_choice_index = 1  # No - AI systems often lack explainability
-                    reasoning = "AI/ML systems typically lack detailed explainability"
-                else:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Rule-based systems can provide explanations"
-            
-            # DEFAULT HANDLING - More nuanced defaults
-            if selected_choice_index is None:
-                # For yes/no questions, be more risk-aware
-                if len(question['choices']) == 2:
-                    # If it's a risk question (higher score for "yes"), default to moderate risk
-                    if question['choices'][0]['score'] > question['choices'][1]['score']:
-                        selected_choice_index = 1  # Lower risk option
-                    else:
-                        selected_choice_index = 0  # Standard option
-                    reasoning = "Conservative default response"
-                else:
-                    # For multi-choice, default to second option (moderate)
-                    selected_choice_index = min(1, len(question['choices']) - 1)
-                    reasoning = "Moderate default response based on limited information"
-            
-            # Ensure index is valid
-            selected_choice_index = max(0, min(selected_choice_index, len(question['choices']) - 1))
-            selected_choice = question['choices'][selected_choice_index]
-            
-            auto_responses.append({
-                'question_id': question_name,
-                'selected_values': [selected_choice['value']],
-                'reasoning': reasoning,
-                'confidence': 0.8 if "clearly indicated" in reasoning or "identified" in reasoning else 0.6
-            })
+        # Automatically answer questions based on comprehensive project analysis.
+        # Rows cover the Design phase questions that have choices, in order, and
+        # hold each question's answer per combination of the indicators its rule
+        # reads (see _build_auto_answer_row). The answers are shared, so callers
+        # get copies.
+        auto_responses = []
+        for row in self._auto_answer_rows:
+            response = row['answers'][indicator_mask & row['answer_mask']]
+            auto_responses.append(dict(response, selected_values=list(response['selected_values'])))
         
         return auto_responses
 
     def _generate_analysis_recommendations(self, impact_level: int, score: int) -> List[str]:
         """Generate recommendations based on preliminary analysis."""
-        recommendations = []
-        
         if impact_level >= 3:
-            recommendations.extend([
-                "⚠️  HIGH RISK SYSTEM DETECTED - Requires qualified oversight",
-                "Implement comprehensive governance framework immediately",
-                "Conduct thorough bias testing and mitigation",
-                "Establish robust monitoring and audit trails",
-                "Plan for external validation and independent oversight"
-            ])
+            recommendations = list(_HIGH_RISK_RECOMMENDATIONS)
         elif impact_level == 2:
-            recommendations.extend([
-                "Moderate risk system - Enhanced oversight required",
-                "Implement bias detection and mitigation measures",
-                "Establish clear audit trails and monitoring",
-                "Plan regular stakeholder consultations"
-            ])
+            recommendations = list(_MODERATE_RISK_RECOMMENDATIONS)
         else:
-            recommendations.extend([
-                "Lower risk system - Standard procedures apply",
-                "Implement basic monitoring and documentation",
-                "Establish clear decision-making processes"
-            ])
+            recommendations = list(_LOWER_RISK_RECOMMENDATIONS)
         
         # Add specific recommendations based on score
-        if score > 40:
-            recommendations.append("Consider if this system truly needs to be fully automated")
-        if score > 25:
-            recommendations.append("Implement human oversight for high-impact decisions")
+        recommendations.extend(message for threshold, message in _SCORE_RECOMMENDATIONS if score > threshold)
         
         return recommendations
 
@@ -428,8 +882,16 @@ class AIAAnalyzer:
         project_name = arguments.get("projectName", "")
         project_description = arguments.get("projectDescription", "")
 
-        logger.info(f"Functional preview for project: {project_name}")
+        logger.info("Functional preview for project: %s", project_name)
+
+        # The preview is a pure function of the name and description, so repeat
+        # previews reuse the cached result; callers get their own copy
+        if isinstance(project_name, str) and isinstance(project_description, str):
+            return copy.deepcopy(self._cached_functional_preview(project_name, project_description))
+        return self._build_functional_preview(project_name, project_description)
 
+    def _build_functional_preview(self, project_name: str, project_description: str) -> Dict[str, Any]:
+        """Build the functional preview result (see _functional_preview)."""
         # Validate project description adequacy for framework assessment
         validation_result = self.description_validator.validate_description(project_description)
         if not validation_result["is_valid"]:
@@ -449,11 +911,12 @@ class AIAAnalyzer:
                 ]
             }
 
-        # Perform functional analysis focusing on technical characteristics
-        functional_responses = self._functional_risk_analysis(project_description)
-        
-        # Calculate functional risk score
-        functional_score = self.aia_processor.calculate_score(functional_responses)
+        # Perform functional analysis focusing on technical characteristics; the
+        # functional risk score is resolved with the responses, and the gap
+        # analysis only reads the shared templates, so nothing is copied
+        functional_responses, functional_score = self._cached_functional_responses(
+            self._functional_indicator_mask(project_description)
+        )
         
         # Analyze gaps and categorize by priority
         gap_analysis = self._analyze_gaps(functional_responses, project_description)
@@ -500,226 +963,71 @@ class AIAAnalyzer:
     def _functional_risk_analysis(self, project_description: str) -> List[Dict[str, Any]]:
         """Analyze project for functional risk characteristics, focusing ONLY on clearly detectable technical aspects."""
         auto_responses = []
-        description_lower = project_description.lower()
-        
-        # Enhanced functional risk indicators
-        risk_indicators = {
-            'high_volume': any(term in description_lower for term in ['thousands', 'millions', 'large scale', 'mass', 'bulk', 'daily', 'hourly', 'real-time', 'continuous']),
-            'personal_data': any(term in description_lower for term in ['personal', 'private', 'confidential', 'sensitive', 'pii', 'credit', 'income', 'employment history', 'financial information']),
-            'financial': any(term in description_lower for term in ['financial', 'money', 'payment', 'economic', 'benefit', 'tax', 'loan', 'credit', 'bank', 'mortgage', 'insurance']),
-            'health': any(term in description_lower for term in ['health', 'medical', 'healthcare', 'patient', 'treatment', 'diagnosis', 'clinical']),
-            'employment': any(term in description_lower for term in ['employment', 'hiring', 'job', 'recruitment', 'hr', 'resume', 'candidate']),
-            'law_enforcement': any(term in description_lower for term in ['police', 'criminal', 'law enforcement', 'investigation', 'security', 'surveillance']),
-            'ai_ml': any(term in description_lower for term in ['ai', 'artificial intelligence', 'machine learning', 'neural', 'deep learning', 'algorithm', 'model', 'trained']),
-            'automated_decision': any(term in description_lower for term in ['automated', 'automatic', 'decision', 'approve', 'deny', 'reject', 'classify', 'determine', 'final decision', 'without human review']),
-            'third_party': any(term in description_lower for term in ['third party', 'third-party', 'vendor', 'contractor', 'external', 'bureau', 'service']),
-            'public_facing': any(term in description_lower for term in ['public', 'citizen', 'client', 'customer', 'user', 'applicant', 'individual']),
-            'full_automation': any(term in description_lower for term in ['without human review', 'automatically approve', 'automatically deny', 'final decision', 'no human intervention']),
-            'real_time': any(term in description_lower for term in ['real-time', 'real time', 'immediate', 'instant', 'live']),
-            'high_impact_decisions': any(term in description_lower for term in ['approve', 'deny', 'reject', 'grant', 'refuse', 'determine eligibility']),
-            'simple_classification': any(term in description_lower for term in ['categorize', 'classify', 'sort', 'organize']) and not any(term in description_lower for term in ['approve', 'deny', 'reject', 'decision']),
-            'human_review': any(term in description_lower for term in ['reviewed by', 'human staff', 'manual review', 'human oversight', 'staff review'])
-        }
+        responses, _ = self._cached_functional_responses(self._functional_indicator_mask(project_description))
+        for response in responses:
+            auto_responses.append(dict(response, selected_values=list(response['selected_values'])))
         
-        # Get all questions for analysis
-        questions_by_name = {q['name']: q for q in self.aia_processor.scorable_questions}
+        return auto_responses
+
+    def _functional_indicator_mask(self, project_description: str) -> int:
+        """Functional risk indicators of a description, masked to the bits the functional rules read."""
+        description_lower = project_description.lower()
         
-        # ONLY answer questions where we have clear functional evidence - be very selective
-        for question in self.aia_processor.scorable_questions:
-            question_name = question['name']
-            question_title = question['title'].lower()
-            
-            # Skip if no choices available
-            if not question.get('choices'):
-                continue
-            
-            selected_choice_index = None
-            reasoning = ""
-            
-            # ONLY ANSWER QUESTIONS WITH CLEAR FUNCTIONAL EVIDENCE
-            
-            # Automation Type - Only if clearly stated
-            if 'type of automation' in question_title or 'automation you are planning' in question_title:
-                if risk_indicators['full_automation']:
-                    selected_choice_index = len(question['choices']) - 1  # Full automation
-                    reasoning = "Full automation clearly stated - no human review mentioned"
-                elif risk_indicators['human_review']:
-                    selected_choice_index = 0  # Partial automation
-                    reasoning = "Human review explicitly mentioned"
-                elif risk_indicators['automated_decision'] and not risk_indicators['human_review']:
-                    selected_choice_index = max(1, len(question['choices']) - 2)  # Mostly automated
-                    reasoning = "Automated decisions mentioned without explicit human review"
-                # Skip if unclear
-            
-            # Economic Impact - Only for clearly financial systems
-            elif 'economic interests' in question_title and 'impact' in question_title:
-                if risk_indicators['financial'] and risk_indicators['high_impact_decisions']:
-                    selected_choice_index = len(question['choices']) - 1  # Very high impact
-                    reasoning = "Financial decisions with clear economic consequences"
-                elif risk_indicators['financial']:
-                    selected_choice_index = max(1, len(question['choices']) - 2)  # High impact
-                    reasoning = "Financial system with economic impact"
-                # Skip if not clearly financial
-            
-            # Rights/Freedoms Impact - Only for high-impact systems
-            elif 'rights or freedoms' in question_title and 'impact' in question_title:
-                if risk_indicators['financial'] and risk_indicators['automated_decision']:
-                    selected_choice_index = len(question['choices']) - 1  # Very high impact
-                    reasoning = "Automated financial decisions impact individual rights"
-                elif risk_indicators['employment'] or risk_indicators['health']:
-                    selected_choice_index = max(1, len(question['choices']) - 2)  # High impact
-                    reasoning = "Employment/health system impacts individual rights"
-                # Skip if impact unclear
-            
-            # Personal Information - Only if explicitly mentioned
-            elif 'personal information' in question_title:
-                if risk_indicators['personal_data']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Personal information usage explicitly mentioned"
-                elif risk_indicators['simple_classification'] and not risk_indicators['personal_data']:
-                    selected_choice_index = 1  # No
-                    reasoning = "Simple classification without personal data"
-                # Skip if unclear
-            
-            # Algorithm Interpretability - Only for AI/ML systems
-            elif 'difficult to interpret' in question_title or 'explain' in question_title:
-                if risk_indicators['ai_ml']:
-                    selected_choice_index = 0  # Yes - difficult to interpret
-                    reasoning = "AI/ML system mentioned - typically less interpretable"
-                elif risk_indicators['simple_classification']:
-                    selected_choice_index = 1  # No - interpretable
-                    reasoning = "Simple classification system - likely interpretable"
-                # Skip if system type unclear
-            
-            # Learning Algorithm - Only for AI/ML systems
-            elif 'continue to learn' in question_title or 'evolve' in question_title:
-                if risk_indicators['ai_ml']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Machine learning system mentioned"
-                elif risk_indicators['simple_classification']:
-                    selected_choice_index = 1  # No
-                    reasoning = "Simple rule-based classification system"
-                # Skip if unclear
-            
-            # Volume/Frequency - Only if clearly stated
-            elif 'frequency' in question_title or 'volume' in question_title or 'how many' in question_title:
-                if risk_indicators['high_volume']:
-                    selected_choice_index = len(question['choices']) - 1  # High volume
-                    reasoning = "High volume processing explicitly mentioned"
-                # Skip if volume not mentioned
-            
-            # Sector-specific - Only if clearly in that sector
-            elif any(sector in question_title for sector in ['health', 'economic', 'employment', 'law enforcement']):
-                if risk_indicators['health'] and 'health' in question_title:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Healthcare system clearly identified"
-                elif risk_indicators['financial'] and ('economic' in question_title or 'financial' in question_title):
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Financial system clearly identified"
-                elif risk_indicators['employment'] and 'employment' in question_title:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Employment system clearly identified"
-                elif risk_indicators['law_enforcement'] and 'law enforcement' in question_title:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Law enforcement system clearly identified"
-                # Skip if sector unclear
-            
-            # Third-party development - Only if explicitly mentioned
-            elif 'developed' in question_title or 'who developed' in question_title:
-                if risk_indicators['third_party']:
-                    # Find third-party option
-                    for i, choice in enumerate(question['choices']):
-                        if 'third party' in choice['text'].lower() or 'non-government' in choice['text'].lower():
-                            selected_choice_index = i
-                            break
-                    if selected_choice_index is not None:
-                        reasoning = "Third-party development explicitly mentioned"
-                # Skip if development source unclear
-            
-            # Real-time processing - Only if explicitly mentioned
-            elif 'real-time' in question_title or 'immediate' in question_title:
-                if risk_indicators['real_time']:
-                    selected_choice_index = 0  # Yes
-                    reasoning = "Real-time processing explicitly mentioned"
-                # Skip if timing unclear
-            
-            # Skip all other questions - don't make assumptions
+        # Enhanced functional risk indicators - one scan of the description
+        indicator_mask = scan_term_mask(description_lower, _INDICATOR_SCANNER)
+        # simple_classification = classification and not decision_language
+        if indicator_mask & (_CLASSIFICATION_BIT | _DECISION_LANGUAGE_BIT) == _CLASSIFICATION_BIT:
+            indicator_mask |= _SIMPLE_CLASSIFICATION_BIT
+        return indicator_mask & self._functional_answer_mask
+
+    def _functional_responses(self, indicator_mask: int) -> tuple:
+        """
+        Resolve the functional responses for an indicator mask.
+
+        Returns (response templates, their official score); the templates are
+        shared, so callers copy them before handing them out.
+        """
+        # ONLY answer questions where we have clear functional evidence - be very
+        # selective. Rows cover just the questions that have a functional rule,
+        # with their answer per indicator combination (see _build_functional_row).
+        responses = []
+        for row in self._functional_rows:
+            response = row['answers'][indicator_mask & row['answer_mask']]
             
             # Only add response if we found clear evidence
-            if selected_choice_index is not None:
-                # Ensure index is valid
-                selected_choice_index = max(0, min(selected_choice_index, len(question['choices']) - 1))
-                selected_choice = question['choices'][selected_choice_index]
-                
-                auto_responses.append({
-                    'question_id': question_name,
-                    'selected_values': [selected_choice['value']],
-                    'reasoning': reasoning,
-                    'confidence': 0.9,  # High confidence since we only answer with clear evidence
-                    'is_functional': True
-                })
-        
-        return auto_responses
+            if response is not None:
+                responses.append(response)
+        return tuple(responses), self.aia_processor.calculate_score(responses)
     
 
     def _analyze_gaps(self, functional_responses: List[Dict[str, Any]], project_description: str) -> Dict[str, List[str]]:
         """Analyze gaps and categorize by impact priority."""
         answered_questions = {r['question_id'] for r in functional_responses}
-        questions_by_name = {q['name']: q for q in self.aia_processor.scorable_questions}
-        
-        critical_gaps = []
-        important_gaps = []
-        administrative_gaps = []
-        
-        # Define critical questions that would significantly change the score
-        critical_question_patterns = [
-            'policy or legal authority',
-            'bias testing',
-            'stakeholder consultation',
-            'impact assessment',
-            'protected characteristics'
-        ]
         
-        # Define important questions that affect compliance planning
-        important_question_patterns = [
-            'oversight',
-            'appeal',
-            'monitoring',
-            'audit',
-            'training'
-        ]
+        gaps = {'critical': [], 'important': [], 'administrative': []}
         
-        for question in self.aia_processor.scorable_questions:
-            if question['name'] not in answered_questions:
-                question_title = question['title'].lower()
-                
-                # Categorize based on question content and potential impact
-                if any(pattern in question_title for pattern in critical_question_patterns):
-                    critical_gaps.append(question['title'])
-                elif any(pattern in question_title for pattern in important_question_patterns):
-                    important_gaps.append(question['title'])
-                elif question.get('max_score', 0) > 2:  # High-scoring questions are important
-                    important_gaps.append(question['title'])
-                else:
-                    administrative_gaps.append(question['title'])
+        # Priorities were assigned from the question titles once (see _gap_priority)
+        for question_name, question_title, priority in self._gap_rows:
+            if question_name not in answered_questions:
+                gaps[priority].append(question_title)
         
         return {
-            'critical': critical_gaps[:5],  # Limit to top 5
-            'important': important_gaps[:7],  # Limit to top 7
-            'administrative': administrative_gaps[:5]  # Limit to top 5
+            'critical': gaps['critical'][:5],  # Limit to top 5
+            'important': gaps['important'][:7],  # Limit to top 7
+            'administrative': gaps['administrative'][:5]  # Limit to top 5
         }
     
 
     def _generate_planning_guidance(self, functional_score: int, project_description: str) -> List[str]:
         """Generate actionable planning guidance based on functional risk score."""
         guidance = []
-        description_lower = project_description.lower()
         
-        # Risk indicators for guidance
-        is_financial = any(term in description_lower for term in ['financial', 'loan', 'credit', 'bank'])
-        is_ai_ml = any(term in description_lower for term in ['ai', 'machine learning', 'neural'])
-        is_high_volume = any(term in description_lower for term in ['thousands', 'daily', 'real-time'])
-        is_automated = any(term in description_lower for term in ['automated', 'without human review'])
+        # Risk indicators for guidance, found in one scan of the description
+        indicators = scan_terms(project_description.lower(), _GUIDANCE_INDICATOR_TERMS, _GUIDANCE_TERM_SCANNER)
+        is_financial = indicators['financial']
+        is_ai_ml = indicators['ai_ml']
+        is_high_volume = indicators['high_volume']
+        is_automated = indicators['automated']
         
         # Score-based guidance
         if functional_score >= 40:
@@ -769,22 +1077,12 @@ class AIAAnalyzer:
 
     def _get_question_category(self, question_name: str) -> str:
         """Get the display category for a question."""
-        # Map internal categories to display categories
-        for category, questions in self.aia_processor.question_categories.items():
-            if question_name in questions:
-                if category == 'technical':
-                    return 'System'  # Most technical questions are system-related
-                elif category == 'impact_risk':
-                    return 'Impact'
-                elif category == 'manual':
-                    return 'Project'
-        return 'System'  # Default
+        return self._category_by_name.get(question_name, 'System')  # Default
     
 
     def _get_impact_level_roman(self, impact_level: int) -> str:
         """Convert impact level number to Roman numeral."""
-        roman_map = {1: 'I', 2: 'II', 3: 'III', 4: 'IV'}
-        return roman_map.get(impact_level, 'I')
+        return _ROMAN_NUMERALS.get(impact_level, 'I')
     
 
     def _get_design_phase_questions(self) -> List[Dict[str, Any]]:
@@ -798,7 +1096,7 @@ class AIAAnalyzer:
         """
         # Load the survey data to check visibility conditions
         try:
-            with open('data/survey-enfr.json', 'r', encoding='utf-8') as f:
+            with open(self.aia_processor.data_path, 'r', encoding='utf-8') as f:
                 survey_data = json.load(f)
         except Exception as e:
             logger.warning(f"Could not load survey data for phase filtering: {e}")
@@ -827,59 +1125,23 @@ class AIAAnalyzer:
         category = arguments.get("category")
         question_type = arguments.get("type")
         
-        logger.info(f"Retrieving questions - category: {category}, type: {question_type}")
-        
-        # Get Design phase questions only (not all 162 questions)
-        all_questions = self._get_design_phase_questions()
-        
-        # Filter by category if specified
-        if category:
-            # Map category names to our internal categories
-            category_map = {
-                "Project": "manual",
-                "System": "technical", 
-                "Algorithm": "technical",
-                "Decision": "impact_risk",
-                "Impact": "impact_risk",
-                "Data": "technical",
-                "Consultations": "manual",
-                "De-risking": "manual"
-            }
-            
-            internal_category = category_map.get(category, "manual")
-            category_questions = self.aia_processor.question_categories.get(internal_category, [])
-            
-            # Get full question details
-            questions_by_name = {q['name']: q for q in all_questions}
-            filtered_questions = []
-            
-            for question_name in category_questions:
-                if question_name in questions_by_name:
-                    filtered_questions.append(questions_by_name[question_name])
-            
-            all_questions = filtered_questions
+        logger.info("Retrieving questions - category: %s, type: %s", category, question_type)
         
-        # Filter by type if specified (risk vs mitigation)
-        if question_type:
-            if question_type == "risk":
-                # Return questions that contribute to risk scoring
-                all_questions = [q for q in all_questions if q.get('max_score', 0) > 0]
-            elif question_type == "mitigation":
-                # Return questions about mitigation measures
-                all_questions = [q for q in all_questions if 'mitigation' in q.get('title', '').lower() or 'measure' in q.get('title', '').lower()]
+        # Design phase questions only (not all 162 questions), pre-filtered by
+        # category and type; unknown categories fall back to "manual" and
+        # unknown types apply no type filter
+        internal_category = _CATEGORY_MAP.get(category, "manual") if category else None
+        type_filter = question_type if question_type in ("risk", "mitigation") else None
+        questions, total_available = self._filtered_questions[(internal_category, type_filter)]
         
         return {
-            "questions": all_questions[:20],  # Limit to first 20 questions
-            "total_available": len(all_questions),
+            "questions": questions,
+            "total_available": total_available,
             "filters_applied": {
                 "category": category,
                 "type": question_type
             },
-            "framework_info": {
-                "name": "Canada's Algorithmic Impact Assessment (Design Phase)",
-                "total_questions": len(self._get_design_phase_questions()),
-                "max_possible_score": sum(q['max_score'] for q in self._get_design_phase_questions())
-            }
+            "framework_info": self._framework_info
         }
     
 
@@ -889,15 +1151,16 @@ class AIAAnalyzer:
         
         # Estimate impact of critical gaps
         if gap_analysis['critical']:
-            if any('policy' in gap.lower() or 'authority' in gap.lower() for gap in gap_analysis['critical']):
+            critical_gaps = [gap.lower() for gap in gap_analysis['critical']]
+            if any('policy' in gap or 'authority' in gap for gap in critical_gaps):
                 new_score = base_score + 3
                 new_level = self.aia_processor.determine_impact_level(new_score)[0]
                 sensitivity['if_policy_authority_needed'] = f"+3 points → likely Level {self._get_impact_level_roman(new_level)}"
             
-            if any('bias' in gap.lower() for gap in gap_analysis['critical']):
+            if any('bias' in gap for gap in critical_gaps):
                 sensitivity['if_no_bias_testing'] = "+2-5 points depending on system complexity"
             
-            if any('consultation' in gap.lower() for gap in gap_analysis['critical']):
+            if any('consultation' in gap for gap in critical_gaps):
                 sensitivity['if_limited_consultation'] = "+1-3 points depending on stakeholder impact"
         
         # Overall range estimate
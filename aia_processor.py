@@ -5,43 +5,129 @@ Handles the core logic for processing Algorithmic Impact Assessments
 based on Canada's AIA framework.
 """
 
+import importlib.util
 import json
 import os
 import re
 from typing import Dict, List, Any, Optional, Tuple
+import functools
 import logging
+
+# anthropic is optional and only used by the AI-assisted helpers. Importing it
+# takes about a second, so it is imported there on first use rather than here.
+ANTHROPIC_AVAILABLE = importlib.util.find_spec("anthropic") is not None
+
+# orjson is optional - it parses the survey file about twice as fast, which
+# shortens the first tool call (processors load lazily)
 try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    ANTHROPIC_AVAILABLE = False
-    anthropic = None
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Name and description per impact level
+_LEVEL_DETAILS = {
+    1: {
+        'name': 'Level I - Little to no impact',
+        'description': 'Little to no impact on individuals or communities. Standard operational procedures apply.'
+    },
+    2: {
+        'name': 'Level II - Moderate impact', 
+        'description': 'Moderate impact on individuals or communities. Enhanced oversight and monitoring required.'
+    },
+    3: {
+        'name': 'Level III - High impact',
+        'description': 'High impact on individuals or communities. Qualified oversight and comprehensive governance required.'
+    },
+    4: {
+        'name': 'Level IV - Very high impact',
+        'description': 'Very high impact on individuals or communities. Qualified oversight, approval, and extensive governance required.'
+    }
+}
+
+# Distinct scores whose impact level is kept per processor
+_IMPACT_LEVEL_CACHE_SIZE = 128
+
+
 class AIAProcessor:
     """Processes AIA assessments and manages questionnaire data."""
     
-    def __init__(self, data_path: str = "data/survey-enfr.json"):
+    def __init__(self, data_path: str = "data/survey-enfr.json", base_dir: Optional[str] = None):
         """
         Initialize the AIA processor.
         
         Args:
-            data_path: Path to the survey data file
+            data_path: Path to the survey data file, relative to base_dir
+            base_dir: Directory that data and config files are resolved against
+                (defaults to this module's directory)
         """
-        self.data_path = data_path
+        self.base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+        self.data_path = os.path.join(self.base_dir, data_path)
         self.survey_data = self._load_survey_data()
         self.scorable_questions = self.extract_official_aia_questions()
         self.question_categories = self.classify_questions()
+
+        # Lookup tables shared by every request - the question set never
+        # changes after load, so build them once here
+        self.questions_by_name = {q['name']: q for q in self.scorable_questions}
+        self.max_possible_score = sum(q['max_score'] for q in self.scorable_questions)
+        # Lowercased titles for the keyword rules that classify questions
+        self.titles_lower = {q['name']: q['title'].lower() for q in self.scorable_questions}
+        # Choice values per question, indexed like the question's choices list
+        self.choice_values = {
+            q['name']: tuple(choice['value'] for choice in (q.get('choices') or ()))
+            for q in self.scorable_questions
+        }
+        # Per-question (sums_selected, {choice value: score}) used by scoring.
+        # Single choice and dropdown questions score the first choice with a
+        # value; multiple choice questions add every choice with that value.
+        # Other scoring types never score.
+        self.score_tables = {}
+        for q in self.scorable_questions:
+            scores = {}
+            scoring_type = q.get('scoring_type')
+            for choice in q.get('choices') or ():
+                if scoring_type == 'multiple_choice':
+                    scores[choice['value']] = scores.get(choice['value'], 0) + choice['score']
+                elif scoring_type in ('single_choice', 'dropdown'):
+                    scores.setdefault(choice['value'], choice['score'])
+            self.score_tables[q['name']] = (scoring_type == 'multiple_choice', scores)
+        self.max_risk_score = sum(q['max_score'] for q in self.scorable_questions if q.get('category') == 'risk')
+        self.max_mitigation_score = sum(q['max_score'] for q in self.scorable_questions if q.get('category') == 'mitigation')
+        # Question counts for get_questions_summary
+        self.risk_question_count = sum(1 for q in self.scorable_questions if q.get('category') == 'risk')
+        self.mitigation_question_count = sum(1 for q in self.scorable_questions if q.get('category') == 'mitigation')
+        self.question_type_counts = {}
+        for q in self.scorable_questions:
+            self.question_type_counts[q['type']] = self.question_type_counts.get(q['type'], 0) + 1
+
+        # Choice value -> (index, choice) per question; the first choice wins
+        # if a value repeats, matching a linear scan of the choices list
+        self.choice_index = {}
+        for q in self.scorable_questions:
+            index = {}
+            for i, choice in enumerate(q.get('choices') or ()):
+                index.setdefault(choice['value'], (i, choice))
+            self.choice_index[q['name']] = index
         
         # Load impact level thresholds from config
         self.impact_thresholds = self._load_impact_thresholds()
+        # Impact level per score - thresholds are fixed after load and
+        # exports and score sensitivity ask for the same few scores repeatedly
+        self._cached_impact_level = functools.lru_cache(maxsize=_IMPACT_LEVEL_CACHE_SIZE)(self._determine_impact_level)
     
     def _load_survey_data(self) -> Dict[str, Any]:
         """Load survey data from JSON file."""
         try:
-            with open(self.data_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.data_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.data_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             logger.info(f"Successfully loaded survey data from {self.data_path}")
             return data
         except FileNotFoundError:
@@ -54,7 +140,7 @@ class AIAProcessor:
     def _load_impact_thresholds(self) -> Dict[int, Tuple[int, int]]:
         """Load impact level thresholds from config.json."""
         try:
-            with open('config.json', 'r', encoding='utf-8') as f:
+            with open(os.path.join(self.base_dir, 'config.json'), 'r', encoding='utf-8') as f:
                 config = json.load(f)
             
             thresholds = {}
@@ -427,55 +513,66 @@ class AIAProcessor:
             Total calculated score
         """
         total_score = 0
-        
-        # Create a lookup dict for questions by name
-        questions_by_name = {q['name']: q for q in self.scorable_questions}
+        # score_tables has an entry for every scorable question
+        score_tables = self.score_tables
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for response in responses:
             question_id = response.get('question_id', '')
-            selected_values = response.get('selected_values', [])
+            if question_id not in score_tables:
+                continue
             
+            selected_values = response.get('selected_values', [])
             if not isinstance(selected_values, list):
                 selected_values = [selected_values]
             
-            question = questions_by_name.get(question_id)
-            if not question:
-                continue
-            
-            # Calculate score based on question type
-            question_score = 0
-            
-            if question['scoring_type'] == 'single_choice':
-                # For single choice, take the score of the selected option
-                if selected_values:
-                    selected_value = selected_values[0]
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            question_score = choice['score']
-                            break
-            
-            elif question['scoring_type'] == 'multiple_choice':
-                # For multiple choice, sum all selected scores
-                for selected_value in selected_values:
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            question_score += choice['score']
-            
-            elif question['scoring_type'] == 'dropdown':
-                # For dropdown, take the score of the selected option
-                if selected_values:
-                    selected_value = selected_values[0]
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            question_score = choice['score']
-                            break
-            
+            question_score = self._question_score(question_id, selected_values)
             total_score += question_score
-            logger.debug(f"Question {question_id}: score={question_score}, total={total_score}")
+            if debug:
+                logger.debug("Question %s: score=%s, total=%s", question_id, question_score, total_score)
         
-        logger.info(f"Total calculated score: {total_score}")
+        logger.info("Total calculated score: %s", total_score)
         return total_score
     
+    def _question_score(self, question_id: str, selected_values: List[Any]) -> int:
+        """
+        Score one response from the precomputed score_tables.
+
+        Single choice and dropdown questions score the first selected value;
+        multiple choice questions sum the scores of all selected values.
+        Values that match no choice score 0.
+        """
+        sums_selected, scores = self.score_tables[question_id]
+        if not sums_selected:
+            # Single value - no loop needed
+            if not selected_values:
+                return 0
+            try:
+                return scores.get(selected_values[0], 0)
+            except TypeError:
+                # Unhashable value - cannot equal any choice value
+                return 0
+        question_score = 0
+        for selected_value in selected_values:
+            try:
+                question_score += scores.get(selected_value, 0)
+            except TypeError:
+                # Unhashable value - cannot equal any choice value
+                pass
+        return question_score
+
+    def _selected_choice(self, question_id: str, selected_value: Any) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Look up a selected value in the choice_index.
+
+        Returns (index, choice), or (0, None) when the value matches no choice.
+        """
+        try:
+            return self.choice_index[question_id].get(selected_value, (0, None))
+        except TypeError:
+            # Unhashable value - cannot equal any choice value
+            return 0, None
+
     def calculate_detailed_score(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calculate detailed scores broken down by risk and mitigation categories.
@@ -486,47 +583,31 @@ class AIAProcessor:
         Returns:
             Dictionary with detailed scoring breakdown
         """
-        risk_score = 0
-        mitigation_score = 0
-        
-        # Create a lookup dict for questions by name
-        questions_by_name = {q['name']: q for q in self.scorable_questions}
-        
+        return self._detailed_score(self._iter_response_values(responses))
+
+    @staticmethod
+    def _iter_response_values(responses: List[Dict[str, Any]]):
+        """Yield (question_id, selected_values list) for scoring-format responses."""
         for response in responses:
             question_id = response.get('question_id', '')
             selected_values = response.get('selected_values', [])
             
             if not isinstance(selected_values, list):
                 selected_values = [selected_values]
-            
+            yield question_id, selected_values
+
+    def _detailed_score(self, selections) -> Dict[str, Any]:
+        """calculate_detailed_score over (question_id, selected_values) pairs."""
+        risk_score = 0
+        mitigation_score = 0
+        questions_by_name = self.questions_by_name
+        
+        for question_id, selected_values in selections:
             question = questions_by_name.get(question_id)
             if not question:
                 continue
             
-            # Calculate score based on question type
-            question_score = 0
-            
-            if question['scoring_type'] == 'single_choice':
-                if selected_values:
-                    selected_value = selected_values[0]
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            question_score = choice['score']
-                            break
-            
-            elif question['scoring_type'] == 'multiple_choice':
-                for selected_value in selected_values:
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            question_score += choice['score']
-            
-            elif question['scoring_type'] == 'dropdown':
-                if selected_values:
-                    selected_value = selected_values[0]
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            question_score = choice['score']
-                            break
+            question_score = self._question_score(question_id, selected_values)
             
             # Add to appropriate category
             if question.get('category') == 'risk':
@@ -538,7 +619,7 @@ class AIAProcessor:
         raw_impact_score = risk_score
         
         # Apply mitigation reduction if mitigation score >= 80% of maximum
-        max_mitigation_score = sum(q['max_score'] for q in self.scorable_questions if q.get('category') == 'mitigation')
+        max_mitigation_score = self.max_mitigation_score
         mitigation_threshold = max_mitigation_score * 0.8
         
         if mitigation_score >= mitigation_threshold:
@@ -551,7 +632,7 @@ class AIAProcessor:
             'raw_impact_score': raw_impact_score,
             'mitigation_score': mitigation_score,
             'final_score': final_score,
-            'max_risk_score': sum(q['max_score'] for q in self.scorable_questions if q.get('category') == 'risk'),
+            'max_risk_score': self.max_risk_score,
             'max_mitigation_score': max_mitigation_score,
             'mitigation_applied': mitigation_score >= mitigation_threshold,
             'mitigation_threshold': mitigation_threshold
@@ -567,10 +648,14 @@ class AIAProcessor:
         Returns:
             Tuple of (level_number, level_name, description)
         """
+        return self._cached_impact_level(score)
+
+    def _determine_impact_level(self, score: int) -> Tuple[int, str, str]:
+        """Compute determine_impact_level's result from the thresholds."""
         for level, (min_score, max_score) in self.impact_thresholds.items():
             if min_score <= score <= max_score:
                 level_info = self._get_level_info(level)
-                logger.info(f"Score {score} corresponds to Impact Level {level}: {level_info['name']}")
+                logger.info("Score %s corresponds to Impact Level %s: %s", score, level, level_info['name'])
                 return level, level_info['name'], level_info['description']
         
         # Fallback to highest level if score exceeds all thresholds
@@ -579,26 +664,7 @@ class AIAProcessor:
     
     def _get_level_info(self, level: int) -> Dict[str, str]:
         """Get detailed information for an impact level."""
-        level_details = {
-            1: {
-                'name': 'Level I - Little to no impact',
-                'description': 'Little to no impact on individuals or communities. Standard operational procedures apply.'
-            },
-            2: {
-                'name': 'Level II - Moderate impact', 
-                'description': 'Moderate impact on individuals or communities. Enhanced oversight and monitoring required.'
-            },
-            3: {
-                'name': 'Level III - High impact',
-                'description': 'High impact on individuals or communities. Qualified oversight and comprehensive governance required.'
-            },
-            4: {
-                'name': 'Level IV - Very high impact',
-                'description': 'Very high impact on individuals or communities. Qualified oversight, approval, and extensive governance required.'
-            }
-        }
-        
-        return level_details.get(level, level_details[4])
+        return _LEVEL_DETAILS.get(level, _LEVEL_DETAILS[4])
     
     def get_questions_summary(self) -> Dict[str, Any]:
         """
@@ -608,26 +674,21 @@ class AIAProcessor:
             Dictionary containing framework information and question statistics
         """
         total_questions = len(self.scorable_questions)
-        max_possible_score = sum(q['max_score'] for q in self.scorable_questions)
-        
-        # Count questions by type
-        question_types = {}
-        for question in self.scorable_questions:
-            q_type = question['type']
-            question_types[q_type] = question_types.get(q_type, 0) + 1
+        max_possible_score = self.max_possible_score
         
-        # Count by category
-        risk_questions = [q for q in self.scorable_questions if q.get('category') == 'risk']
-        mitigation_questions = [q for q in self.scorable_questions if q.get('category') == 'mitigation']
+        # Counts by type and category were taken at load time
+        question_types = dict(self.question_type_counts)
+        risk_questions = self.risk_question_count
+        mitigation_questions = self.mitigation_question_count
         
         return {
             'framework_name': 'Canada\'s Official Algorithmic Impact Assessment',
             'total_questions': total_questions,
-            'risk_questions': len(risk_questions),
-            'mitigation_questions': len(mitigation_questions),
+            'risk_questions': risk_questions,
+            'mitigation_questions': mitigation_questions,
             'max_possible_score': max_possible_score,
-            'max_risk_score': sum(q['max_score'] for q in risk_questions),
-            'max_mitigation_score': sum(q['max_score'] for q in mitigation_questions),
+            'max_risk_score': self.max_risk_score,
+            'max_mitigation_score': self.max_mitigation_score,
             'question_types': question_types,
             'question_categories': {
                 'technical': len(self.question_categories['technical']),
@@ -647,8 +708,8 @@ class AIAProcessor:
             'expected_mitigation': 41,
             'expected_max_score': 244,
             'actual_total': total_questions,
-            'actual_risk': len(risk_questions),
-            'actual_mitigation': len(mitigation_questions),
+            'actual_risk': risk_questions,
+            'actual_mitigation': mitigation_questions,
             'actual_max_score': max_possible_score
         }
     
@@ -686,11 +747,12 @@ class AIAProcessor:
             }
         
         try:
+            import anthropic
             client = anthropic.Anthropic(api_key=api_key)
             
             # Get technical questions only
             technical_questions = []
-            questions_by_name = {q['name']: q for q in self.scorable_questions}
+            questions_by_name = self.questions_by_name
             
             for question_name in self.question_categories['technical']:
                 if question_name in questions_by_name:
@@ -810,10 +872,11 @@ Focus on technical aspects that can be determined from the project description.
             }
         
         try:
+            import anthropic
             client = anthropic.Anthropic(api_key=api_key)
             
             # Build prompt for reasoning
-            questions_by_name = {q['name']: q for q in self.scorable_questions}
+            questions_by_name = self.questions_by_name
             
             prompt = f"""You are an expert in Canada's Algorithmic Impact Assessment (AIA) framework.
 
@@ -830,12 +893,7 @@ Selected Answers:
                 
                 if question_id in questions_by_name:
                     question = questions_by_name[question_id]
-                    selected_choice = None
-                    
-                    for choice in question['choices']:
-                        if choice['value'] == selected_value:
-                            selected_choice = choice
-                            break
+                    _, selected_choice = self._selected_choice(question_id, selected_value)
                     
                     if selected_choice:
                         prompt += f"\nQuestion: {question['title']}\n"
@@ -912,10 +970,10 @@ Please provide detailed reasoning for each answer in JSON format:
         detailed_score = self.calculate_detailed_score(responses)
         total_score = detailed_score['final_score']
         impact_level, level_name, level_description = self.determine_impact_level(total_score)
-        max_possible_score = sum(q['max_score'] for q in self.scorable_questions)
+        max_possible_score = self.max_possible_score
         
         # Categorize responses
-        questions_by_name = {q['name']: q for q in self.scorable_questions}
+        questions_by_name = self.questions_by_name
         auto_populated = []
         manual_required = []
         
@@ -933,11 +991,8 @@ Please provide detailed reasoning for each answer in JSON format:
                     question = questions_by_name[question_id]
                     
                     # Find selected choice text
-                    selected_text = "Unknown"
-                    for choice in question['choices']:
-                        if choice['value'] == response.get('selected_values', [None])[0]:
-                            selected_text = choice['text']
-                            break
+                    _, selected_choice = self._selected_choice(question_id, response.get('selected_values', [None])[0])
+                    selected_text = selected_choice['text'] if selected_choice else "Unknown"
                     
                     auto_populated.append({
                         'question_id': question_id,
@@ -1090,6 +1145,91 @@ Please provide detailed reasoning for each answer in JSON format:
         
         return notes
     
+    def convert_responses(self, responses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert MCP tool responses into the format used for scoring.
+
+        Args:
+            responses: List of {"questionId", "selectedOption"} dicts, where
+                selectedOption is an index into the question's choices
+
+        Returns:
+            List of {"question_id", "selected_values"} dicts
+        """
+        return [
+            {
+                "question_id": question_id,
+                "selected_values": [choice_value]
+            }
+            for question_id, choice_value in self._iter_selected_options(responses)
+        ]
+
+    def _iter_selected_options(self, responses: List[Dict[str, Any]]):
+        """Yield (question_id, choice value) for MCP {questionId, selectedOption} responses."""
+        # Hoisted lookup - this loop runs once per answered question
+        choice_values_get = self.choice_values.get
+
+        for response in responses:
+            question_id = response.get("questionId", "")
+            selected_option = response.get("selectedOption", 0)
+
+            choices = choice_values_get(question_id)
+            if choices:
+                if 0 <= selected_option < len(choices):
+                    choice_value = choices[selected_option]
+                else:
+                    logger.warning("Invalid selectedOption %s for question %s", selected_option, question_id)
+                    # Fallback to first choice if index is invalid
+                    choice_value = choices[0]
+            else:
+                logger.warning("Question %s not found or has no choices", question_id)
+                # Fallback for unknown questions
+                choice_value = f"item{selected_option + 1}-0"
+
+            yield question_id, choice_value
+
+    def assess_project_options(self, project_name: str, project_description: str,
+                               responses: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Assess a project from MCP {questionId, selectedOption} responses.
+
+        Same result as assess_project(convert_responses(responses)), but the
+        selected options are scored directly instead of being rebuilt into
+        response dicts first.
+        """
+        if not responses:
+            return self.assess_project(project_name, project_description)
+        selections = [
+            (question_id, (choice_value,))
+            for question_id, choice_value in self._iter_selected_options(responses)
+        ]
+        return self._completed_assessment(project_name, project_description,
+                                          self._detailed_score(selections), len(responses))
+
+    def _completed_assessment(self, project_name: str, project_description: str,
+                              detailed_score: Dict[str, Any], responses_count: int) -> Dict[str, Any]:
+        """Build the 'completed' assess_project result from a detailed score."""
+        from datetime import datetime
+
+        total_score = detailed_score['final_score']
+        impact_level, level_name, level_description = self.determine_impact_level(total_score)
+        
+        return {
+            'project_name': project_name,
+            'project_description': project_description,
+            'timestamp': datetime.now().isoformat(),
+            'total_score': total_score,
+            'raw_impact_score': detailed_score['raw_impact_score'],
+            'mitigation_score': detailed_score['mitigation_score'],
+            'impact_level': impact_level,
+            'level_name': level_name,
+            'level_description': level_description,
+            'max_possible_score': self.max_possible_score,
+            'responses_count': responses_count,
+            'mitigation_applied': detailed_score['mitigation_applied'],
+            'status': 'completed'
+        }
+
     def assess_project(self, project_name: str, project_description: str, 
                       responses: Optional[List[Dict]] = None) -> Dict[str, Any]:
         """
@@ -1107,25 +1247,8 @@ Please provide detailed reasoning for each answer in JSON format:
         
         if responses:
             # Calculate detailed score and determine impact level
-            detailed_score = self.calculate_detailed_score(responses)
-            total_score = detailed_score['final_score']
-            impact_level, level_name, level_description = self.determine_impact_level(total_score)
-            
-            return {
-                'project_name': project_name,
-                'project_description': project_description,
-                'timestamp': datetime.now().isoformat(),
-                'total_score': total_score,
-                'raw_impact_score': detailed_score['raw_impact_score'],
-                'mitigation_score': detailed_score['mitigation_score'],
-                'impact_level': impact_level,
-                'level_name': level_name,
-                'level_description': level_description,
-                'max_possible_score': sum(q['max_score'] for q in self.scorable_questions),
-                'responses_count': len(responses),
-                'mitigation_applied': detailed_score['mitigation_applied'],
-                'status': 'completed'
-            }
+            return self._completed_assessment(project_name, project_description,
+                                              self.calculate_detailed_score(responses), len(responses))
         else:
             # Return questions that need to be answered
             return {
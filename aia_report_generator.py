@@ -12,12 +12,30 @@ This module mirrors osfi_e23_report_generators.py and provides:
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from docx import Document
+import io
 import os
+import re
 import logging
 
+from utils.docx_template import new_document
+from utils.term_scanner import build_term_scanner, scan_terms
+
 logger = logging.getLogger(__name__)
 
+# Characters dropped from project names used in report filenames - anything
+# but letters, digits, spaces, '-' and '_' (\w is str.isalnum() plus '_')
+_FILENAME_UNSAFE_CHARS = re.compile(r'[^\w \-]')
+
+# Executive summary system characteristics and the description terms behind
+# them (substring match on the lowercased description), scanned in one pass
+_SUMMARY_CHARACTERISTIC_TERMS = {
+    "AI/ML-powered": ('ai', 'machine learning', 'neural'),
+    "financial decision-making": ('financial', 'loan', 'credit'),
+    "automated processing": ('automated', 'automatic'),
+    "personal data usage": ('personal', 'sensitive', 'private')
+}
+_SUMMARY_CHARACTERISTIC_SCANNER = build_term_scanner(_SUMMARY_CHARACTERISTIC_TERMS)
+
 
 class AIAReportGenerator:
     """
@@ -27,14 +45,17 @@ class AIAReportGenerator:
     Algorithmic Impact Assessment framework.
     """
 
-    def __init__(self, aia_data_extractor):
+    def __init__(self, aia_data_extractor, base_dir: Optional[str] = None):
         """
         Initialize AIA report generator.
         
         Args:
             aia_data_extractor: AIADataExtractor instance for data extraction
+            base_dir: Directory the AIA_Assessments folder is created in
+                (defaults to this module's directory)
         """
         self.aia_data_extractor = aia_data_extractor
+        self.base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
 
     def _get_design_phase_questions(self) -> List[Dict[str, Any]]:
         """Get design phase questions - delegates to data extractor's processor."""
@@ -65,9 +86,11 @@ class AIAReportGenerator:
         return None
 
 
-    def _generate_executive_summary(self, score: int, impact_level: str, project_description: str) -> str:
+    def _generate_executive_summary(self, score: int, impact_level: str, project_description: str,
+                                    description_lower: Optional[str] = None) -> str:
         """Generate executive summary based on assessment results."""
-        description_lower = project_description.lower()
+        if description_lower is None:
+            description_lower = project_description.lower()
 
         # Determine risk level
         if score >= 56:
@@ -81,15 +104,8 @@ class AIAReportGenerator:
             summary_start = "This system presents relatively low algorithmic impact risks"
 
         # Add system characteristics
-        characteristics = []
-        if any(term in description_lower for term in ['ai', 'machine learning', 'neural']):
-            characteristics.append("AI/ML-powered")
-        if any(term in description_lower for term in ['financial', 'loan', 'credit']):
-            characteristics.append("financial decision-making")
-        if any(term in description_lower for term in ['automated', 'automatic']):
-            characteristics.append("automated processing")
-        if any(term in description_lower for term in ['personal', 'sensitive', 'private']):
-            characteristics.append("personal data usage")
+        matched = scan_terms(description_lower, _SUMMARY_CHARACTERISTIC_TERMS, _SUMMARY_CHARACTERISTIC_SCANNER)
+        characteristics = [characteristic for characteristic, found in matched.items() if found]
 
         char_text = ", ".join(characteristics) if characteristics else "automated decision-making"
 
@@ -181,23 +197,25 @@ class AIAReportGenerator:
         
         try:
             # Create AIA_Assessments directory if it doesn't exist
-            assessments_dir = "./AIA_Assessments"
+            assessments_dir = os.path.join(self.base_dir, "AIA_Assessments")
             os.makedirs(assessments_dir, exist_ok=True)
             
-            # Generate filename
-            current_date = datetime.now().strftime("%Y-%m-%d")
+            # Generate filename - one timestamp for the filename and the
+            # report's Date line, so they agree even across midnight
+            now = datetime.now()
+            current_date = now.strftime("%Y-%m-%d")
             if custom_filename:
                 filename = f"{custom_filename}.docx"
             else:
                 # Clean project name for filename
-                clean_project_name = "".join(c for c in project_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                clean_project_name = _FILENAME_UNSAFE_CHARS.sub('', project_name).rstrip()
                 clean_project_name = clean_project_name.replace(' ', '_')
                 filename = f"AIA_Report_{clean_project_name}_{current_date}.docx"
             
             file_path = os.path.join(assessments_dir, filename)
             
-            # Create Word document
-            doc = Document()
+            # Create Word document from the cached blank template
+            doc = new_document()
             
             # Add title
             title = doc.add_heading('AIA Assessment Report', 0)
@@ -206,35 +224,36 @@ class AIAReportGenerator:
             # Add project info
             doc.add_heading('Project Information', level=1)
             doc.add_paragraph(f'Project: {project_name}')
-            doc.add_paragraph(f'Date: {datetime.now().strftime("%B %d, %Y")}')
+            doc.add_paragraph(f'Date: {now.strftime("%B %d, %Y")}')
             
             # Extract assessment data
             score = self.aia_data_extractor.extract_score(assessment_results)
             impact_level = self.aia_data_extractor.extract_impact_level(assessment_results)
-            design_phase_questions = self._get_design_phase_questions()
-            max_score = sum(q['max_score'] for q in design_phase_questions)
+            max_score = self.aia_data_extractor.aia_processor.max_possible_score
             
             doc.add_paragraph(f'Impact Level: {impact_level}')
             doc.add_paragraph(f'Score: {score}/{max_score} points')
             
             # Add executive summary
             doc.add_heading('Executive Summary', level=1)
-            summary = self._generate_executive_summary(score, impact_level, project_description)
+            # Lowercased once for the summary and key findings keyword scans
+            description_lower = project_description.lower()
+            summary = self._generate_executive_summary(score, impact_level, project_description, description_lower)
             doc.add_paragraph(self._strip_markdown_formatting(summary))
 
             # Add key findings
             doc.add_heading('Key Findings', level=1)
-            findings = self.aia_data_extractor.extract_key_findings(assessment_results, project_description)
+            findings = self.aia_data_extractor.extract_key_findings(assessment_results, project_description, description_lower)
+            # Resolve the bullet style once and apply it as each paragraph is added
+            bullet_style = doc.styles['List Bullet']
             for finding in findings:
-                p = doc.add_paragraph(self._strip_markdown_formatting(finding))
-                p.style = 'List Bullet'
+                doc.add_paragraph(self._strip_markdown_formatting(finding), style=bullet_style)
 
             # Add recommendations
             doc.add_heading('Recommendations', level=1)
             recommendations = self.aia_data_extractor.extract_recommendations(assessment_results, score, impact_level)
             for recommendation in recommendations:
-                p = doc.add_paragraph(self._strip_markdown_formatting(recommendation))
-                p.style = 'List Bullet'
+                doc.add_paragraph(self._strip_markdown_formatting(recommendation), style=bullet_style)
 
             # Add project description
             doc.add_heading('Project Description', level=1)
@@ -245,11 +264,16 @@ class AIAReportGenerator:
             disclaimer_text = self._get_assessment_disclaimer(assessment_results)
             doc.add_paragraph(disclaimer_text)
             
-            # Save document
-            doc.save(file_path)
+            # Save document - serialized in memory first so the size comes from the
+            # bytes written instead of a stat of the saved file
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            document_bytes = buffer.getvalue()
+            with open(file_path, 'wb') as f:
+                f.write(document_bytes)
             
             # Get file size
-            file_size = os.path.getsize(file_path)
+            file_size = len(document_bytes)
             file_size_kb = round(file_size / 1024, 1)
             
             return {
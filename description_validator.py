@@ -79,6 +79,17 @@ class ProjectDescriptionValidator:
             }
         }
 
+        # Per area: (keyword, lowercased keyword) pairs and one compiled
+        # alternation of the lowercased keywords, so each sentence is checked
+        # with a single search instead of a scan per keyword
+        self._area_keywords = {
+            area_key: (
+                tuple((keyword, keyword.lower()) for keyword in area_config["keywords"]),
+                re.compile("|".join(re.escape(keyword.lower()) for keyword in area_config["keywords"]))
+            )
+            for area_key, area_config in self.content_areas.items()
+        }
+
         # Minimum requirements for validation
         self.min_total_words = 100
         self.min_areas_covered = 3  # 50% of 6 areas
@@ -157,20 +168,21 @@ class ProjectDescriptionValidator:
     def _analyze_coverage(self, description: str) -> Dict[str, Any]:
         """Analyze coverage of each content area in the description."""
         coverage_details = {}
+        # Every area looks at the same sentences - split once
+        sentences = description.split('.')
 
         for area_key, area_config in self.content_areas.items():
+            keywords, keyword_pattern = self._area_keywords[area_key]
+
             # Count keyword matches
-            keyword_matches = []
-            for keyword in area_config["keywords"]:
-                if keyword.lower() in description:
-                    keyword_matches.append(keyword)
+            keyword_matches = [keyword for keyword, keyword_lower in keywords if keyword_lower in description]
 
-            # Extract sentences containing keywords for word count
-            sentences = description.split('.')
+            # Extract sentences containing keywords for word count (keywords
+            # never contain '.', so with no match in the description no
+            # sentence can match either)
             relevant_sentences = []
-            for sentence in sentences:
-                if any(keyword.lower() in sentence for keyword in area_config["keywords"]):
-                    relevant_sentences.append(sentence.strip())
+            if keyword_matches:
+                relevant_sentences = [sentence.strip() for sentence in sentences if keyword_pattern.search(sentence)]
 
             # Count words in relevant content
             relevant_text = ' '.join(relevant_sentences)
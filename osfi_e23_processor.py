@@ -9,7 +9,7 @@ risk_dimension_extraction.py for factor/dimension scoring).
 
 import json
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,14 +17,17 @@ logger = logging.getLogger(__name__)
 class OSFIE23Processor:
     """Processes OSFI E-23 Model Risk Management assessments."""
 
-    def __init__(self, data_path: str = "data/osfi_e23_framework.json"):
+    def __init__(self, data_path: str = "data/osfi_e23_framework.json", base_dir: Optional[str] = None):
         """
         Initialize the OSFI E-23 processor.
 
         Args:
-            data_path: Path to the E-23 framework data file
+            data_path: Path to the E-23 framework data file, relative to base_dir
+            base_dir: Directory that data files are resolved against
+                (defaults to this module's directory)
         """
-        self.data_path = data_path
+        self.base_dir = base_dir or os.path.dirname(os.path.abspath(__file__))
+        self.data_path = os.path.join(self.base_dir, data_path)
         self.framework_data = self._load_framework_data()
 
     def _load_framework_data(self) -> Dict[str, Any]:
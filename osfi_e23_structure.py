@@ -17,6 +17,7 @@ Risk Assessment Framework (v3.0):
 
 from typing import Dict, List, Any
 import logging
+import re
 
 # Import new risk dimensions framework
 from osfi_e23_risk_dimensions import (
@@ -135,6 +136,39 @@ APPENDIX_1_STAGE_SPECIFIC = {
 # LIFECYCLE STAGE DETECTION
 # ============================================================================
 
+# Stage indicators (ordered by specificity/priority)
+_STAGE_INDICATORS = {
+    "decommission": [
+        "retiring", "retirement", "decommission", "decommissioning", "sunsetting",
+        "end of life", "discontinuing", "phasing out", "sunset"
+    ],
+    "monitoring": [
+        "deployed", "in production", "live", "operational",
+        "monitoring", "production environment", "post-deployment"
+    ],
+    "deployment": [
+        "deploy", "deploying", "implementing", "implementation",
+        "go-live", "rollout", "production preparation", "deployment phase"
+    ],
+    "review": [
+        "review", "reviewing", "validation", "validating", "testing",
+        "under review", "being validated", "independent assessment",
+        "validation phase", "review stage"
+    ],
+    "design": [
+        "design", "designing", "develop", "developing", "in development",
+        "planning", "creating", "building", "early stage", "conceptual",
+        "design phase", "development phase", "prototype", "prototyping"
+    ]
+}
+
+# One compiled alternation per stage, checked in the order above
+_STAGE_PATTERNS = tuple(
+    (stage, re.compile("|".join(map(re.escape, indicators))))
+    for stage, indicators in _STAGE_INDICATORS.items()
+)
+
+
 def detect_lifecycle_stage(project_description: str) -> str:
     """
     Detect current lifecycle stage from project description.
@@ -156,35 +190,9 @@ def detect_lifecycle_stage(project_description: str) -> str:
 
     description_lower = project_description.lower()
 
-    # Stage indicators (ordered by specificity/priority)
-    stage_indicators = {
-        "decommission": [
-            "retiring", "retirement", "decommission", "decommissioning", "sunsetting",
-            "end of life", "discontinuing", "phasing out", "sunset"
-        ],
-        "monitoring": [
-            "deployed", "in production", "live", "operational",
-            "monitoring", "production environment", "post-deployment"
-        ],
-        "deployment": [
-            "deploy", "deploying", "implementing", "implementation",
-            "go-live", "rollout", "production preparation", "deployment phase"
-        ],
-        "review": [
-            "review", "reviewing", "validation", "validating", "testing",
-            "under review", "being validated", "independent assessment",
-            "validation phase", "review stage"
-        ],
-        "design": [
-            "design", "designing", "develop", "developing", "in development",
-            "planning", "creating", "building", "early stage", "conceptual",
-            "design phase", "development phase", "prototype", "prototyping"
-        ]
-    }
-
     # Check stages in priority order
-    for stage, indicators in stage_indicators.items():
-        if any(indicator in description_lower for indicator in indicators):
+    for stage, pattern in _STAGE_PATTERNS:
+        if pattern.search(description_lower):
             logger.info(f"Detected lifecycle stage: {stage}")
             return stage
 
@@ -526,18 +534,20 @@ def get_principle_text(principle_number: str) -> str:
     """Get full text of OSFI Principle."""
     return OSFI_PRINCIPLES.get(principle_number, "Unknown principle")
 
+# AI/ML indicator terms for is_ai_ml_model (substring match)
+_AI_ML_PATTERN = re.compile("|".join(map(re.escape, [
+    "ai", "artificial intelligence", "ml", "machine learning",
+    "neural network", "deep learning", "algorithm", "predictive",
+    "random forest", "gradient boost", "decision tree", "regression"
+])))
+
+
 def is_ai_ml_model(project_description: str) -> bool:
     """
     Determine if model is AI/ML based on description.
     Used to include AI/ML specific requirements.
     """
-    description_lower = project_description.lower()
-    ai_ml_indicators = [
-        "ai", "artificial intelligence", "ml", "machine learning",
-        "neural network", "deep learning", "algorithm", "predictive",
-        "random forest", "gradient boost", "decision tree", "regression"
-    ]
-    return any(indicator in description_lower for indicator in ai_ml_indicators)
+    return _AI_ML_PATTERN.search(project_description.lower()) is not None
 
 
 # ============================================================================
@@ -10,6 +10,9 @@ import json
 import re
 from typing import Dict, List, Any, Optional
 
+# Element types that represent answerable questions (panels are containers)
+_QUESTION_TYPES = frozenset({'radiogroup', 'checkbox', 'dropdown'})
+
 def load_survey_data(file_path: str) -> Dict[str, Any]:
     """Load the survey JSON data."""
     with open(file_path, 'r', encoding='utf-8') as f:
@@ -28,51 +31,54 @@ def extract_score_from_value(value: str) -> Optional[int]:
 
 def analyze_question_element(element: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze a single question element and extract scoring information."""
+    # Extract title text (default English) - the raw bilingual dict is not kept
+    title = element.get('title', {})
+    if isinstance(title, dict):
+        title_text = title.get('default', '')
+    else:
+        title_text = str(title)
+    
     question_info = {
         'name': element.get('name', ''),
         'type': element.get('type', ''),
-        'title': element.get('title', {}),
+        'title_text': title_text,
         'has_scoring': False,
-        'choices': [],
+        # Choices are stored as parallel arrays (value/text/score per index)
+        'choice_values': [],
+        'choice_texts': [],
+        'choice_scores': [],
         'max_score': 0,
         'scoring_type': None
     }
     
-    # Extract title text (default English)
-    if isinstance(question_info['title'], dict):
-        question_info['title_text'] = question_info['title'].get('default', '')
-    else:
-        question_info['title_text'] = str(question_info['title'])
-    
     # Check if element has choices with scoring
     choices = element.get('choices', [])
     if choices:
-        scored_choices = []
+        choice_values = question_info['choice_values']
+        choice_texts = question_info['choice_texts']
+        choice_scores = question_info['choice_scores']
         max_score = 0
         
         for choice in choices:
-            choice_info = {
-                'value': choice.get('value', ''),
-                'text': choice.get('text', {}),
-                'score': None
-            }
+            value = choice.get('value', '')
+            text = choice.get('text', {})
             
             # Extract choice text
-            if isinstance(choice_info['text'], dict):
-                choice_info['text_display'] = choice_info['text'].get('default', '')
+            if isinstance(text, dict):
+                text_display = text.get('default', '')
             else:
-                choice_info['text_display'] = str(choice_info['text'])
+                text_display = str(text)
             
             # Extract score from value
-            score = extract_score_from_value(choice_info['value'])
+            score = extract_score_from_value(value)
             if score is not None:
-                choice_info['score'] = score
                 question_info['has_scoring'] = True
                 max_score = max(max_score, score)
             
-            scored_choices.append(choice_info)
+            choice_values.append(value)
+            choice_texts.append(text_display)
+            choice_scores.append(score)
         
-        question_info['choices'] = scored_choices
         question_info['max_score'] = max_score
         
         # Determine scoring type
@@ -121,7 +127,7 @@ def analyze_survey_structure(survey_data: Dict[str, Any]) -> Dict[str, Any]:
             if element.get('type') == 'panel':
                 sub_elements = element.get('elements', [])
                 for sub_element in sub_elements:
-                    if sub_element.get('type') in ['radiogroup', 'checkbox', 'dropdown']:
+                    if sub_element.get('type') in _QUESTION_TYPES:
                         analysis['total_questions'] += 1
                         question_info = analyze_question_element(sub_element)
                         page_info['elements'].append(question_info)
@@ -137,7 +143,7 @@ def analyze_survey_structure(survey_data: Dict[str, Any]) -> Dict[str, Any]:
                             analysis['max_possible_score'] += question_info['max_score']
             
             # Handle direct elements
-            elif element.get('type') in ['radiogroup', 'checkbox', 'dropdown']:
+            elif element.get('type') in _QUESTION_TYPES:
                 analysis['total_questions'] += 1
                 question_info = analyze_question_element(element)
                 page_info['elements'].append(question_info)
@@ -185,12 +191,12 @@ def print_analysis_summary(analysis: Dict[str, Any]):
         print(f"   Title: {question['title_text'][:100]}{'...' if len(question['title_text']) > 100 else ''}")
         print(f"   Scoring Type: {question['scoring_type']}")
         
-        if question['choices']:
+        if question['choice_values']:
             print("   Choices:")
-            for choice in question['choices']:
-                score_text = f" (Score: {choice['score']})" if choice['score'] is not None else ""
-                choice_text = choice['text_display'][:60] + ('...' if len(choice['text_display']) > 60 else '')
-                print(f"     - {choice['value']}: {choice_text}{score_text}")
+            for value, text, score in zip(question['choice_values'], question['choice_texts'], question['choice_scores']):
+                score_text = f" (Score: {score})" if score is not None else ""
+                choice_text = text[:60] + ('...' if len(text) > 60 else '')
+                print(f"     - {value}: {choice_text}{score_text}")
 
 def save_summary_to_json(analysis: Dict[str, Any], output_file: str):
     """Save a summary of scorable questions to JSON file."""
@@ -214,12 +220,12 @@ def save_summary_to_json(analysis: Dict[str, Any], output_file: str):
             'max_score': question['max_score'],
             'choices': [
                 {
-                    'value': choice['value'],
-                    'text': choice['text_display'],
-                    'score': choice['score']
+                    'value': value,
+                    'text': text,
+                    'score': score
                 }
-                for choice in question['choices']
-                if choice['score'] is not None
+                for value, text, score in zip(question['choice_values'], question['choice_texts'], question['choice_scores'])
+                if score is not None
             ]
         }
         summary['scorable_questions'].append(question_summary)
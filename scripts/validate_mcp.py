@@ -12,6 +12,12 @@ import os
 import platform
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 class MCPValidator:
     """Comprehensive validator for AIA Assessment MCP Server Claude Desktop integration."""
@@ -121,7 +127,7 @@ class MCPValidator:
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
+                text=False,  # Binary pipes - JSON-RPC lines are encoded/decoded as UTF-8 bytes
                 cwd=str(self.current_dir)
             )
             
@@ -133,7 +139,7 @@ class MCPValidator:
                 self.print_step("Server process status", "✅ Running")
                 return True
             else:
-                stderr_output = self.server_process.stderr.read()
+                stderr_output = self.server_process.stderr.read().decode('utf-8', errors='replace')
                 self.print_step("Server process status", f"❌ Crashed: {stderr_output}")
                 return False
                 
@@ -144,14 +150,18 @@ class MCPValidator:
     def send_json_rpc_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Send a JSON-RPC request to the server."""
         try:
-            request_json = json.dumps(request) + "\n"
-            self.server_process.stdin.write(request_json)
+            if ORJSON_AVAILABLE:
+                request_bytes = orjson.dumps(request) + b"\n"
+            else:
+                request_bytes = json.dumps(request).encode('utf-8') + b"\n"
+            self.server_process.stdin.write(request_bytes)
             self.server_process.stdin.flush()
             
             # Read response with timeout
             response_line = self.server_process.stdout.readline()
             if response_line:
-                return json.loads(response_line.strip())
+                # Both parsers accept bytes directly and ignore the trailing newline
+                return orjson.loads(response_line) if ORJSON_AVAILABLE else json.loads(response_line)
             else:
                 return None
         except Exception as e:
@@ -15,38 +15,265 @@ Framework Details:
 - Based on specific questionnaire with 48+ questions across 8 categories
 """
 
+import asyncio
+import io
 import json
 import logging
+import queue
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 import sys
 import os
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from aia_processor import AIAProcessor
-from osfi_e23_processor import OSFIE23Processor
-from description_validator import ProjectDescriptionValidator
-from workflow_engine import WorkflowEngine
-from utils.framework_detection import FrameworkDetector
 from config.tool_registry import ToolRegistry
-from utils.data_extractors import AIADataExtractor, OSFIE23DataExtractor
-from aia_analysis import AIAAnalyzer
-from introduction_builder import IntroductionBuilder
-from aia_report_generator import AIAReportGenerator
-from osfi_e23_report_generators import generate_osfi_e23_report
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+
+# orjson is optional - it parses and serializes JSON-RPC messages several times
+# faster than the stdlib, which matters for large assessment payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# msgspec is optional - it provides the MessagePack codec for MCP_FRAMING=msgpack
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+# Configure logging - DEBUG=1 enables per-request tracing on stderr
+logging.basicConfig(level=logging.DEBUG if os.environ.get("DEBUG") == "1" else logging.INFO, stream=sys.stderr)
 logger = logging.getLogger(__name__)
 
+# Indent tool result text (MCP_PRETTY=1) - compact by default
+PRETTY_TOOL_RESULTS = os.environ.get("MCP_PRETTY") == "1"
+
+# stdin reader: blocking reads on the main thread by default, or an asyncio
+# event loop with MCP_IO=asyncio (falls back when stdin is not a pipe)
+STDIO_PUMP = os.environ.get("MCP_IO", "").lower()
+
+# Longest message the asyncio reader accepts (the blocking reader has no limit)
+ASYNC_READ_LIMIT = 64 * 1024 * 1024
+
+# Characters dropped from project names used in report filenames - anything
+# but letters, digits, spaces, '-' and '_' (\w is str.isalnum() plus '_')
+_FILENAME_UNSAFE_CHARS = re.compile(r'[^\w \-]')
+
+# Read buffer for blocking stdin reads - larger than the 8 KiB default so big
+# assessment payloads arrive in fewer read() calls
+STDIN_BUFFER_SIZE = 64 * 1024
+
+# Request handler threads (MCP_WORKERS). Defaults to 1 because clients rely on
+# in-order side effects (introduction gate, workflow sessions); the reader and
+# writer still overlap with request handling either way.
+try:
+    REQUEST_WORKERS = max(1, int(os.environ.get("MCP_WORKERS", "1")))
+except ValueError:
+    REQUEST_WORKERS = 1
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse a JSON-RPC message straight from the raw bytes read off stdin."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    # MCP stdio is UTF-8 - decode strictly instead of letting json.loads guess
+    # an encoding, so bad bytes are a parse error (as with orjson), not a crash
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        raise json.JSONDecodeError(f"Invalid UTF-8: {e.reason}", '', e.start) from None
+    return json.loads(text)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON-RPC message to UTF-8 bytes for stdout."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    # Compact separators match orjson's output
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+if MSGSPEC_AVAILABLE:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+    # Errors that mean an incoming message could not be parsed
+    _MESSAGE_DECODE_ERRORS = (json.JSONDecodeError, msgspec.DecodeError)
+else:
+    _MESSAGE_DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+def _json_dumps_text(obj: Any) -> str:
+    """
+    Serialize a tool result to text for the MCP content envelope.
+
+    Output is compact since MCP clients parse it; MCP_PRETTY=1 restores
+    indented output for reading raw stdio traffic.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY_TOOL_RESULTS else 0)
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    # Like orjson, keep non-ASCII text as-is - the envelope encoder escapes
+    # it once instead of the escapes being escaped again
+    if PRETTY_TOOL_RESULTS:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+# Static JSON-RPC error objects, shared by every response that uses them
+# (responses are serialized, never mutated)
+_PARSE_ERROR = {"code": -32700, "message": "Parse error"}
+_INVALID_REQUEST_ERROR = {"code": -32600, "message": "Invalid Request"}
+
+
+def _error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """Build a JSON-RPC error response."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class _ToolResponse:
+    """
+    Successful tools/call response whose envelope is spliced at write time.
+
+    The tool result is already serialized to text, so the surrounding
+    JSON-RPC envelope is written as fixed bytes around the encoded text
+    instead of being built as a dict and serialized again.
+    """
+
+    __slots__ = ("request_id", "text")
+
+    def __init__(self, request_id: Any, text: str):
+        self.request_id = request_id
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"_ToolResponse(id={self.request_id!r}, text={len(self.text)} chars)"
+
+    def encode(self) -> bytes:
+        return (
+            b'{"jsonrpc":"2.0","id":' + _json_dumps(self.request_id)
+            + b',"result":{"content":[{"type":"text","text":' + _json_dumps(self.text)
+            + b'}],"isError":false}}'
+        )
+
+    def to_message(self) -> Dict[str, Any]:
+        """The response as a plain dict, for non-JSON wire formats."""
+        return {"jsonrpc": "2.0", "id": self.request_id,
+                "result": {"content": [{"type": "text", "text": self.text}], "isError": False}}
+
+
+class _CachedResultResponse:
+    """
+    Response whose result was serialized once and is reused across requests.
+
+    Only the request id is encoded per response; the result bytes are
+    spliced in as-is. The unserialized result is kept for non-JSON wire
+    formats.
+    """
+
+    __slots__ = ("request_id", "result_json", "result")
+
+    def __init__(self, request_id: Any, result_json: bytes, result: Any):
+        self.request_id = request_id
+        self.result_json = result_json
+        self.result = result
+
+    def __repr__(self) -> str:
+        return f"_CachedResultResponse(id={self.request_id!r}, result={len(self.result_json)} bytes)"
+
+    def encode(self) -> bytes:
+        return b'{"jsonrpc":"2.0","id":' + _json_dumps(self.request_id) + b',"result":' + self.result_json + b'}'
+
+    def to_message(self) -> Dict[str, Any]:
+        """The response as a plain dict, for non-JSON wire formats."""
+        return {"jsonrpc": "2.0", "id": self.request_id, "result": self.result}
+
+
+# Serialized tools/list result, built on first use (see _tools_list_result_json)
+_TOOLS_LIST_RESULT_JSON: Optional[bytes] = None
+
+
+def _tools_list_result_json() -> bytes:
+    """Serialize the static tools/list result once per process."""
+    global _TOOLS_LIST_RESULT_JSON
+    if _TOOLS_LIST_RESULT_JSON is None:
+        _TOOLS_LIST_RESULT_JSON = _json_dumps(ToolRegistry.get_tools_result())
+    return _TOOLS_LIST_RESULT_JSON
+
+
+def _encode_message(message: Any) -> bytes:
+    """Serialize an outgoing JSON-RPC message to bytes for stdout."""
+    if isinstance(message, (_ToolResponse, _CachedResultResponse)):
+        return message.encode()
+    if isinstance(message, list):
+        # Batch response - entries may themselves be spliced tool responses
+        return b"[" + b",".join(_encode_message(item) for item in message) + b"]"
+    return _json_dumps(message)
+
+
+def _msgpack_message(message: Any) -> Any:
+    """Replace spliced responses (at any batch position) with plain dicts."""
+    if isinstance(message, (_ToolResponse, _CachedResultResponse)):
+        return message.to_message()
+    if isinstance(message, list):
+        return [_msgpack_message(item) for item in message]
+    return message
+
+
+def _encode_message_msgpack(message: Any) -> bytes:
+    """Serialize an outgoing JSON-RPC message to MessagePack (MCP_FRAMING=msgpack)."""
+    return _MSGPACK_ENCODER.encode(_msgpack_message(message))
+
+
 class MCPServer:
     """Simple MCP server implementation using JSON-RPC over stdio."""
 
+    # Fixed attribute set - no per-instance __dict__ behind hot-path attribute access
+    __slots__ = (
+        "server_info", "introduction_shown", "_init_result", "_methods", "_tools",
+        "_processors_loaded", "aia_processor", "osfi_e23_processor",
+        "description_validator", "workflow_engine", "framework_detector",
+        "aia_data_extractor", "osfi_data_extractor", "aia_analyzer",
+        "introduction_builder", "aia_report_generator",
+        "_in", "_out", "_framing", "_out_queue", "_writer", "_base_dir",
+        "_load_lock", "_pool", "_pending", "_completer",
+    )
+
+    # Tools that execute_workflow_step may run (dispatched through _tools)
+    _WORKFLOW_STEP_TOOLS = frozenset({
+        "validate_project_description", "assess_project", "analyze_project_description",
+        "functional_preview", "assess_model_risk", "get_questions",
+        "export_assessment_report", "export_e23_report",
+    })
+
+    # Export tool -> (framework whose results it exports, label for logs,
+    # assessment result fields that mark usable results, execution_result
+    # reported by auto-execution when there are no results to export)
+    _EXPORT_TOOLS = {
+        "export_assessment_report": ("aia", "AIA", ("score", "impact_level"), {
+            "error": "Cannot execute export - no assessment results available",
+            "reason": "Missing assessment data from functional_preview or assess_project",
+            "required_action": "Execute functional_preview or assess_project first",
+            "workflow_guidance": "Use 'get_workflow_status' to see required dependencies"
+        }),
+        "export_e23_report": ("osfi_e23", "OSFI E-23", ("risk_score", "risk_level"), {
+            "error": "Cannot execute export - no E-23 assessment results available",
+            "reason": "Missing assessment data from assess_model_risk or related tools",
+            "required_action": "Execute assess_model_risk first",
+            "workflow_guidance": "Use 'get_workflow_status' to see required dependencies"
+        }),
+    }
+
     def __init__(self):
-        # Change to the script's directory to ensure data files are found
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        os.chdir(script_dir)
-        print(f"DEBUG: Changed working directory to: {script_dir}", file=sys.stderr)
+        # Data files and export folders are resolved against the script's
+        # directory explicitly instead of changing the process-wide CWD
+        self._base_dir = os.path.dirname(os.path.abspath(__file__))
+        logger.debug("Resolving data files against: %s", self._base_dir)
 
         self.server_info = {
             "name": "aia-assessment-server",
@@ -54,7 +281,49 @@ class MCPServer:
         }
         self.introduction_shown = False
 
+        # Invariant part of the initialize result - only protocolVersion
+        # varies per client (shared, treat as read-only)
+        self._init_result = {
+            "capabilities": {
+                "tools": {"listChanged": False}
+            },
+            "serverInfo": self.server_info,
+            "instructions": (
+                "Use these tools when users ask about regulatory compliance, risk assessment, "
+                "or need to run an AIA (Algorithmic Impact Assessment) or OSFI E-23 (Model Risk Management) "
+                "assessment. Start with get_server_introduction at the beginning of any assessment conversation. "
+                "AIA applies to Canadian government automated decision systems. "
+                "OSFI E-23 applies to federally regulated financial institutions."
+            )
+        }
+
+        # JSON-RPC method dispatch (notifications/* are handled separately)
+        self._methods = {
+            "initialize": self._initialize,
+            "tools/list": lambda request_id, params: self._list_tools(request_id, splice_result=True),
+            "tools/call": lambda request_id, params: self._call_tool(request_id, params, splice_envelope=True),
+            "ping": lambda request_id, params: {"jsonrpc": "2.0", "id": request_id, "result": {}},
+        }
+
+        # Tool name -> handler taking the tool arguments
+        self._tools = {
+            "get_server_introduction": self._get_server_introduction,
+            "create_workflow": self._create_workflow,
+            "execute_workflow_step": self._execute_workflow_step,
+            "get_workflow_status": self._get_workflow_status,
+            "auto_execute_workflow": self._auto_execute_workflow,
+            "validate_project_description": self._validate_project_description,
+            "assess_project": self._assess_project,
+            "analyze_project_description": self._analyze_project_description,
+            "get_questions": self._get_questions,
+            "functional_preview": self._functional_preview,
+            "export_assessment_report": self._export_assessment_report,
+            "assess_model_risk": self._assess_model_risk,
+            "export_e23_report": self._export_e23_report,
+        }
+
         # Heavy processors loaded lazily on first tool call
+        self._load_lock = threading.Lock()
         self._processors_loaded = False
         self.aia_processor = None
         self.osfi_e23_processor = None
@@ -71,19 +340,34 @@ class MCPServer:
         """Load heavy processors on first tool call rather than at startup."""
         if self._processors_loaded:
             return
-        print("DEBUG: Loading processors...", file=sys.stderr)
-        self.aia_processor = AIAProcessor()
-        self.osfi_e23_processor = OSFIE23Processor()
-        self.description_validator = ProjectDescriptionValidator()
-        self.workflow_engine = WorkflowEngine()
-        self.framework_detector = FrameworkDetector(self.workflow_engine)
-        self.aia_data_extractor = AIADataExtractor(self.aia_processor)
-        self.osfi_data_extractor = OSFIE23DataExtractor(self.osfi_e23_processor)
-        self.aia_analyzer = AIAAnalyzer(self.aia_processor, self.description_validator)
-        self.introduction_builder = IntroductionBuilder(self.framework_detector)
-        self.aia_report_generator = AIAReportGenerator(self.aia_data_extractor)
-        self._processors_loaded = True
-        print("DEBUG: Processors loaded.", file=sys.stderr)
+        with self._load_lock:
+            # Another worker may have finished loading while we waited
+            if self._processors_loaded:
+                return
+            logger.debug("Loading processors...")
+            # Imported here so initialize and tools/list never pay for the
+            # processors, python-docx or lxml
+            from aia_processor import AIAProcessor
+            from osfi_e23_processor import OSFIE23Processor
+            from description_validator import ProjectDescriptionValidator
+            from workflow_engine import WorkflowEngine
+            from utils.framework_detection import FrameworkDetector
+            from utils.data_extractors import AIADataExtractor, OSFIE23DataExtractor
+            from aia_analysis import AIAAnalyzer
+            from introduction_builder import IntroductionBuilder
+            from aia_report_generator import AIAReportGenerator
+            self.aia_processor = AIAProcessor(base_dir=self._base_dir)
+            self.osfi_e23_processor = OSFIE23Processor(base_dir=self._base_dir)
+            self.description_validator = ProjectDescriptionValidator()
+            self.workflow_engine = WorkflowEngine()
+            self.framework_detector = FrameworkDetector(self.workflow_engine)
+            self.aia_data_extractor = AIADataExtractor(self.aia_processor)
+            self.osfi_data_extractor = OSFIE23DataExtractor(self.osfi_e23_processor)
+            self.aia_analyzer = AIAAnalyzer(self.aia_processor, self.description_validator)
+            self.introduction_builder = IntroductionBuilder(self.framework_detector)
+            self.aia_report_generator = AIAReportGenerator(self.aia_data_extractor, base_dir=self._base_dir)
+            self._processors_loaded = True
+            logger.debug("Processors loaded.")
         
     def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming MCP requests."""
@@ -92,64 +376,32 @@ class MCPServer:
             params = request.get("params", {})
             request_id = request.get("id")
             
-            print(f"Handling request - Method: {method}, ID: {request_id}", file=sys.stderr)
+            logger.debug("Handling request - Method: %s, ID: %s", method, request_id)
             
-            if method == "initialize":
-                return self._initialize(request_id, params)
-            elif method == "tools/list":
-                return self._list_tools(request_id)
-            elif method == "tools/call":
-                return self._call_tool(request_id, params)
-            elif method == "ping":
-                return {"jsonrpc": "2.0", "id": request_id, "result": {}}
-            elif method == "notifications/initialized":
-                # Handle notification - no response needed
-                print(f"Received notification: {method}", file=sys.stderr)
-                return None
-            elif method.startswith("notifications/"):
-                # Ignore all other notifications silently
+            handler = self._methods.get(method)
+            if handler is not None:
+                return handler(request_id, params)
+
+            if method.startswith("notifications/"):
+                # Notifications need no response
+                logger.debug("Received notification: %s", method)
                 return None
-            elif method in ["prompts/list", "resources/list"]:
-                # Handle unsupported methods gracefully
-                print(f"Unsupported method: {method}", file=sys.stderr)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
-                }
-            else:
-                print(f"Unknown method: {method}", file=sys.stderr)
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
-                }
+
+            logger.debug("Unknown method: %s", method)
+            return _error_response(request_id, -32601, f"Method not found: {method}")
         except Exception as e:
-            print(f"ERROR in handle_request: {str(e)}", file=sys.stderr)
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}", file=sys.stderr)
-            logger.error(f"Error handling request: {str(e)}")
-            return {
-                "jsonrpc": "2.0",
-                "id": request.get("id"),
-                "error": {
-                    "code": -32603,
-                    "message": f"Internal error: {str(e)}"
-                }
-            }
+            logger.debug("ERROR in handle_request: %s", e, exc_info=True)
+            logger.error("Error handling request: %s", e)
+            return _error_response(request.get("id"), -32603, f"Internal error: {str(e)}")
     
     def _initialize(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request."""
-        import sys
+        # One level check per call instead of one per trace line
+        debug = logger.isEnabledFor(logging.DEBUG)
         try:
-            print(f"Initialize called with params: {params}", file=sys.stderr)
-            print(f"Request ID: {request_id}", file=sys.stderr)
+            if debug:
+                logger.debug("Initialize called with params: %s", params)
+                logger.debug("Request ID: %s", request_id)
             
             # Accept the client's protocol version
             client_protocol_version = params.get("protocolVersion", "2024-11-05")
@@ -159,47 +411,33 @@ class MCPServer:
                 "id": request_id,
                 "result": {
                     "protocolVersion": client_protocol_version,
-                    "capabilities": {
-                        "tools": {"listChanged": False}
-                    },
-                    "serverInfo": self.server_info,
-                    "instructions": (
-                        "Use these tools when users ask about regulatory compliance, risk assessment, "
-                        "or need to run an AIA (Algorithmic Impact Assessment) or OSFI E-23 (Model Risk Management) "
-                        "assessment. Start with get_server_introduction at the beginning of any assessment conversation. "
-                        "AIA applies to Canadian government automated decision systems. "
-                        "OSFI E-23 applies to federally regulated financial institutions."
-                    )
+                    **self._init_result
                 }
             }
             
-            print(f"Initialize response prepared: {result}", file=sys.stderr)
-            print("DEBUG: About to return initialize response", file=sys.stderr)
+            if debug:
+                logger.debug("Initialize response prepared: %s", result)
+                logger.debug("About to return initialize response")
             return result
             
         except Exception as e:
-            print(f"ERROR in _initialize: {str(e)}", file=sys.stderr)
-            print(f"Exception type: {type(e)}", file=sys.stderr)
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}", file=sys.stderr)
+            logger.debug("ERROR in _initialize: %s", e)
+            logger.debug("Exception type: %s", type(e), exc_info=True)
             
             # Return error response
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {
-                    "code": -32603,
-                    "message": f"Initialization failed: {str(e)}"
-                }
-            }
+            return _error_response(request_id, -32603, f"Initialization failed: {str(e)}")
     
-    def _list_tools(self, request_id: Any) -> Dict[str, Any]:
+    def _list_tools(self, request_id: Any, splice_result: bool = False) -> Any:
         """
         List available tools.
 
         This method delegates to the ToolRegistry for tool definitions
         to maintain separation of concerns and reduce server complexity.
+        With splice_result (the stdio path) the tool list is serialized once
+        and only the request id is encoded per response.
         """
+        if splice_result:
+            return _CachedResultResponse(request_id, _tools_list_result_json(), ToolRegistry.get_tools_result())
         return ToolRegistry.format_list_tools_response(request_id)
     
     def _get_or_create_auto_session(self, project_name: str, assessment_type: str = "osfi_e23") -> str:
@@ -213,7 +451,7 @@ class MCPServer:
         # Check if session exists
         existing_session = self.workflow_engine.get_session(session_id)
         if existing_session:
-            logger.info(f"Retrieved existing auto-session: {session_id}")
+            logger.info("Retrieved existing auto-session: %s", session_id)
             return session_id
 
         # Create new session manually with our desired session_id
@@ -221,14 +459,15 @@ class MCPServer:
 
         workflow_type = AssessmentType.OSFI_E23 if assessment_type == "osfi_e23" else AssessmentType.AIA_FULL
 
+        created_at = datetime.now().isoformat()
         session = {
             "session_id": session_id,
             "project_name": project_name,
             "project_description": "",  # Will be filled by first tool call
             "assessment_type": workflow_type.value,
             "state": WorkflowState.CREATED.value,
-            "created_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
+            "created_at": created_at,
+            "last_accessed": created_at,
             "completed_tools": [],
             "tool_results": {},
             "current_step": 0,
@@ -239,7 +478,7 @@ class MCPServer:
         # Store in workflow engine's sessions
         self.workflow_engine.sessions[session_id] = session
 
-        logger.info(f"Created auto-session for direct tool calls: {session_id}")
+        logger.info("Created auto-session for direct tool calls: %s", session_id)
         return session_id
 
     def _store_tool_result_in_session(self, session_id: str, tool_name: str, tool_result: Dict[str, Any]):
@@ -253,7 +492,7 @@ class MCPServer:
             }
             if tool_name not in session["completed_tools"]:
                 session["completed_tools"].append(tool_name)
-            logger.info(f"Stored {tool_name} result in session {session_id}")
+            logger.info("Stored %s result in session %s", tool_name, session_id)
 
     def _get_or_set_lifecycle_stage(self, session_id: str, provided_stage: str = None, project_description: str = "") -> str:
         """
@@ -277,7 +516,7 @@ class MCPServer:
         """
         session = self.workflow_engine.get_session(session_id)
         if not session:
-            logger.warning(f"No session found for {session_id}, defaulting to 'design' stage")
+            logger.warning("No session found for %s, defaulting to 'design' stage", session_id)
             return 'design'
 
         # Normalize provided stage if given
@@ -287,19 +526,19 @@ class MCPServer:
             if stage_normalized in valid_stages:
                 # Store in session for consistency across all steps
                 session["lifecycle_stage"] = stage_normalized
-                logger.info(f"Lifecycle stage set to '{stage_normalized}' for session {session_id}")
+                logger.info("Lifecycle stage set to '%s' for session %s", stage_normalized, session_id)
                 return stage_normalized
             else:
-                logger.warning(f"Invalid stage '{provided_stage}', using session or default")
+                logger.warning("Invalid stage '%s', using session or default", provided_stage)
 
         # Check if stage already stored in session
         if "lifecycle_stage" in session:
-            logger.info(f"Using lifecycle stage '{session['lifecycle_stage']}' from session")
+            logger.info("Using lifecycle stage '%s' from session", session['lifecycle_stage'])
             return session["lifecycle_stage"]
 
         # Default to 'design'
         session["lifecycle_stage"] = 'design'
-        logger.info(f"No lifecycle stage specified, defaulting to 'design' for session {session_id}")
+        logger.info("No lifecycle stage specified, defaulting to 'design' for session %s", session_id)
         return 'design'
 
     def _get_assessment_results_for_export_from_session(self, session_id: str, framework_type: str) -> Optional[Dict[str, Any]]:
@@ -310,8 +549,14 @@ class MCPServer:
 
         return self._get_assessment_results_for_export(session, framework_type)
 
-    def _call_tool(self, request_id: Any, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Call a specific tool."""
+    def _call_tool(self, request_id: Any, params: Dict[str, Any], splice_envelope: bool = False) -> Dict[str, Any]:
+        """
+        Call a specific tool.
+
+        With splice_envelope=True (the stdio path) a successful call returns a
+        _ToolResponse so the envelope is spliced around the serialized result
+        when it is written, rather than being built and serialized as a dict.
+        """
         self._load_processors()
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
@@ -323,66 +568,17 @@ class MCPServer:
         if tool_name in osfi_tools:
             project_name = arguments.get("projectName") or arguments.get("project_name", "UnnamedProject")
             session_id = self._get_or_create_auto_session(project_name, "osfi_e23")
-            logger.info(f"Using auto-session {session_id} for {tool_name}")
+            logger.info("Using auto-session %s for %s", session_id, tool_name)
 
         try:
-            if tool_name == "get_server_introduction":
-                result = self._get_server_introduction(arguments)
-            elif tool_name == "create_workflow":
-                result = self._create_workflow(arguments)
-            elif tool_name == "execute_workflow_step":
-                result = self._execute_workflow_step(arguments)
-            elif tool_name == "get_workflow_status":
-                result = self._get_workflow_status(arguments)
-            elif tool_name == "auto_execute_workflow":
-                result = self._auto_execute_workflow(arguments)
-            elif tool_name == "validate_project_description":
-                result = self._validate_project_description(arguments)
-            elif tool_name == "assess_project":
-                result = self._assess_project(arguments)
-            elif tool_name == "analyze_project_description":
-                result = self._analyze_project_description(arguments)
-            elif tool_name == "get_questions":
-                result = self._get_questions(arguments)
-            elif tool_name == "functional_preview":
-                result = self._functional_preview(arguments)
-            elif tool_name == "export_assessment_report":
-                result = self._export_assessment_report(arguments)
-            elif tool_name == "assess_model_risk":
-                result = self._assess_model_risk(arguments)
-            elif tool_name == "export_e23_report":
-                # Auto-inject assessment_results from session if not provided or incomplete
-                if session_id:
-                    assessment_results = arguments.get("assessment_results", {})
-                    # Check for REQUIRED keys, not just empty - Claude might pass partial data
-                    required_keys = ["factor_scores", "dimension_assessments"]
-                    has_required_keys = all(key in assessment_results for key in required_keys)
-
-                    if not assessment_results or not has_required_keys:
-                        # Try to get from session
-                        framework_results = self._get_assessment_results_for_export_from_session(session_id, "osfi_e23")
-                        if framework_results:
-                            arguments["assessment_results"] = framework_results
-                            logger.info(f"Auto-injected assessment_results from session {session_id} (partial data detected: missing {[k for k in required_keys if k not in assessment_results]})")
-
-                    # Auto-inject current_stage from assess_model_risk if available
-                    session = self.workflow_engine.get_session(session_id)
-                    if session and "tool_results" in session and "assess_model_risk" in session["tool_results"]:
-                        step2_result = session["tool_results"]["assess_model_risk"].get("result", {})
-                        if "current_stage" in step2_result:
-                            arguments["current_stage"] = step2_result["current_stage"]
-                            logger.info(f"Auto-injected current_stage '{step2_result['current_stage']}' from Step 2 session data")
-
-                result = self._export_e23_report(arguments)
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Unknown tool: {tool_name}"
-                    }
-                }
+            handler = self._tools.get(tool_name)
+            if handler is None:
+                return _error_response(request_id, -32601, f"Unknown tool: {tool_name}")
+
+            if tool_name == "export_e23_report":
+                self._inject_e23_session_data(arguments, session_id)
+
+            result = handler(arguments)
 
             # Store result in session for OSFI tools (except export which is terminal)
             if session_id and tool_name in osfi_tools and tool_name != "export_e23_report":
@@ -393,7 +589,10 @@ class MCPServer:
             if isinstance(result, str):
                 result_text = result
             else:
-                result_text = json.dumps(result, indent=2)
+                result_text = _json_dumps_text(result)
+
+            if splice_envelope:
+                return _ToolResponse(request_id, result_text)
 
             return {
                 "jsonrpc": "2.0",
@@ -410,9 +609,8 @@ class MCPServer:
             }
 
         except Exception as e:
-            logger.error(f"Error in tool {tool_name}: {str(e)}")
-            import traceback
-            print(f"Tool error traceback: {traceback.format_exc()}", file=sys.stderr)
+            logger.error("Error in tool %s: %s", tool_name, e)
+            logger.debug("Tool error traceback", exc_info=True)
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
@@ -427,6 +625,31 @@ class MCPServer:
                 }
             }
 
+    def _inject_e23_session_data(self, arguments: Dict[str, Any], session_id: Optional[str]):
+        """Fill export_e23_report arguments from the OSFI E-23 auto-session."""
+        # Auto-inject assessment_results from session if not provided or incomplete
+        if session_id:
+            assessment_results = arguments.get("assessment_results", {})
+            # Check for REQUIRED keys, not just empty - Claude might pass partial data
+            required_keys = ["factor_scores", "dimension_assessments"]
+            has_required_keys = all(key in assessment_results for key in required_keys)
+
+            if not assessment_results or not has_required_keys:
+                # Try to get from session
+                framework_results = self._get_assessment_results_for_export_from_session(session_id, "osfi_e23")
+                if framework_results:
+                    arguments["assessment_results"] = framework_results
+                    logger.info("Auto-injected assessment_results from session %s (partial data detected: missing %s)",
+                                session_id, [k for k in required_keys if k not in assessment_results])
+
+            # Auto-inject current_stage from assess_model_risk if available
+            session = self.workflow_engine.get_session(session_id)
+            if session and "tool_results" in session and "assess_model_risk" in session["tool_results"]:
+                step2_result = session["tool_results"]["assess_model_risk"].get("result", {})
+                if "current_stage" in step2_result:
+                    arguments["current_stage"] = step2_result["current_stage"]
+                    logger.info("Auto-injected current_stage '%s' from Step 2 session data", step2_result['current_stage'])
+
     def _detect_framework_context(self, user_context: str = "", session_id: str = None) -> str:
         """
         Detect which framework to emphasize based on user context and session state.
@@ -548,61 +771,32 @@ class MCPServer:
         try:
             # CRITICAL FIX: Auto-inject assessment results for export tools if missing
             # This prevents generating misleading reports with default values (0/100, "Medium")
-            if tool_name in ["export_assessment_report", "export_e23_report"]:
+            export_tool = self._EXPORT_TOOLS.get(tool_name)
+            if export_tool:
+                framework_type, framework_label, result_fields, _ = export_tool
                 session = self.workflow_engine.get_session(session_id)
                 if session:
                     assessment_results_arg = tool_arguments.get("assessment_results", {})
 
                     # Check if assessment_results is empty or missing required fields
+                    # (risk score/level for OSFI E-23, score/impact level for AIA)
                     is_empty = not assessment_results_arg or len(assessment_results_arg) == 0
-
-                    # For OSFI E-23, check for required risk assessment fields
-                    if tool_name == "export_e23_report":
-                        has_risk_data = "risk_score" in assessment_results_arg or "risk_level" in assessment_results_arg
-                        if is_empty or not has_risk_data:
-                            # Attempt to auto-inject from workflow state
-                            framework_results = self._get_assessment_results_for_export(session, "osfi_e23")
-                            if framework_results:
-                                # Unwrap 'assessment' wrapper if present
-                                if "assessment" in framework_results and isinstance(framework_results["assessment"], dict):
-                                    tool_arguments["assessment_results"] = framework_results["assessment"]
-                                else:
-                                    tool_arguments["assessment_results"] = framework_results
-                                logger.info(f"Auto-injected OSFI E-23 assessment results from workflow state for {session_id}")
-
-                    # For AIA, check for required assessment fields
-                    elif tool_name == "export_assessment_report":
-                        has_assessment_data = "score" in assessment_results_arg or "impact_level" in assessment_results_arg
-                        if is_empty or not has_assessment_data:
-                            # Attempt to auto-inject from workflow state
-                            framework_results = self._get_assessment_results_for_export(session, "aia")
-                            if framework_results:
-                                # Unwrap 'assessment' wrapper if present
-                                if "assessment" in framework_results and isinstance(framework_results["assessment"], dict):
-                                    tool_arguments["assessment_results"] = framework_results["assessment"]
-                                else:
-                                    tool_arguments["assessment_results"] = framework_results
-                                logger.info(f"Auto-injected AIA assessment results from workflow state for {session_id}")
+                    has_assessment_data = any(field in assessment_results_arg for field in result_fields)
+                    if is_empty or not has_assessment_data:
+                        # Attempt to auto-inject from workflow state
+                        framework_results = self._get_assessment_results_for_export(session, framework_type)
+                        if framework_results:
+                            # Unwrap 'assessment' wrapper if present
+                            if "assessment" in framework_results and isinstance(framework_results["assessment"], dict):
+                                tool_arguments["assessment_results"] = framework_results["assessment"]
+                            else:
+                                tool_arguments["assessment_results"] = framework_results
+                            logger.info("Auto-injected %s assessment results from workflow state for %s", framework_label, session_id)
 
             # Execute the actual tool
-            if tool_name == "validate_project_description":
-                tool_result = self._validate_project_description(tool_arguments)
-            elif tool_name == "assess_project":
-                tool_result = self._assess_project(tool_arguments)
-            elif tool_name == "analyze_project_description":
-                tool_result = self._analyze_project_description(tool_arguments)
-            elif tool_name == "functional_preview":
-                tool_result = self._functional_preview(tool_arguments)
-            elif tool_name == "assess_model_risk":
-                tool_result = self._assess_model_risk(tool_arguments)
-            elif tool_name == "get_questions":
-                tool_result = self._get_questions(tool_arguments)
-            elif tool_name == "export_assessment_report":
-                tool_result = self._export_assessment_report(tool_arguments)
-            elif tool_name == "export_e23_report":
-                tool_result = self._export_e23_report(tool_arguments)
-            else:
+            if tool_name not in self._WORKFLOW_STEP_TOOLS:
                 return {"error": f"Tool '{tool_name}' not supported in workflow execution"}
+            tool_result = self._tools[tool_name](tool_arguments)
 
             # Update workflow state
             workflow_info = self.workflow_engine.execute_tool(session_id, tool_name, tool_result)
@@ -667,33 +861,11 @@ class MCPServer:
                 }
 
                 # Add special arguments for export tools
-                if tool_name == "export_assessment_report":
+                export_tool = self._EXPORT_TOOLS.get(tool_name)
+                if export_tool:
+                    framework_type, _, _, missing_results_error = export_tool
                     # Get assessment results from previous tools
-                    assessment_results = self._get_assessment_results_for_export(session, "aia")
-                    if assessment_results:
-                        tool_arguments.update({
-                            "project_name": session["project_name"],
-                            "project_description": session["project_description"],
-                            "assessment_results": assessment_results
-                        })
-                    else:
-                        # Return clear error instead of silent skip
-                        results.append({
-                            "tool_name": tool_name,
-                            "step_number": step["step_number"],
-                            "execution_result": {
-                                "error": "Cannot execute export - no assessment results available",
-                                "reason": "Missing assessment data from functional_preview or assess_project",
-                                "required_action": "Execute functional_preview or assess_project first",
-                                "workflow_guidance": "Use 'get_workflow_status' to see required dependencies"
-                            },
-                            "success": False
-                        })
-                        break
-
-                elif tool_name == "export_e23_report":
-                    # Get E-23 assessment results from previous tools
-                    assessment_results = self._get_assessment_results_for_export(session, "osfi_e23")
+                    assessment_results = self._get_assessment_results_for_export(session, framework_type)
                     if assessment_results:
                         tool_arguments.update({
                             "project_name": session["project_name"],
@@ -705,12 +877,7 @@ class MCPServer:
                         results.append({
                             "tool_name": tool_name,
                             "step_number": step["step_number"],
-                            "execution_result": {
-                                "error": "Cannot execute export - no E-23 assessment results available",
-                                "reason": "Missing assessment data from assess_model_risk or related tools",
-                                "required_action": "Execute assess_model_risk first",
-                                "workflow_guidance": "Use 'get_workflow_status' to see required dependencies"
-                            },
+                            "execution_result": dict(missing_results_error),
                             "success": False
                         })
                         break
@@ -844,7 +1011,7 @@ class MCPServer:
         project_description = arguments.get("projectDescription", "")
         responses = arguments.get("responses")
 
-        logger.info(f"Assessing project: {project_name}")
+        logger.info("Assessing project: %s", project_name)
 
         # Validate project description adequacy for framework assessment
         validation_result = self.description_validator.validate_description(project_description)
@@ -865,49 +1032,11 @@ class MCPServer:
                 ]
             }
         
-        # Convert responses format if provided
-        converted_responses = None
-        if responses:
-            converted_responses = []
-            # Create a lookup dict for questions by name (Design phase only)
-            design_phase_questions = self._get_design_phase_questions()
-            questions_by_name = {q['name']: q for q in design_phase_questions}
-            
-            for response in responses:
-                question_id = response.get("questionId", "")
-                selected_option = response.get("selectedOption", 0)
-                
-                # Find the question and get the actual choice value
-                question = questions_by_name.get(question_id)
-                if question and question.get('choices'):
-                    # selectedOption is an index (0, 1, 2, etc.), get the actual choice value
-                    if 0 <= selected_option < len(question['choices']):
-                        choice_value = question['choices'][selected_option]['value']
-                        converted_responses.append({
-                            "question_id": question_id,
-                            "selected_values": [choice_value]
-                        })
-                    else:
-                        logger.warning(f"Invalid selectedOption {selected_option} for question {question_id}")
-                        # Fallback to first choice if index is invalid
-                        choice_value = question['choices'][0]['value'] if question['choices'] else "item1-0"
-                        converted_responses.append({
-                            "question_id": question_id,
-                            "selected_values": [choice_value]
-                        })
-                else:
-                    logger.warning(f"Question {question_id} not found or has no choices")
-                    # Fallback for unknown questions
-                    converted_responses.append({
-                        "question_id": question_id,
-                        "selected_values": [f"item{selected_option + 1}-0"]
-                    })
-        
-        # Use the existing AIAProcessor logic
-        result = self.aia_processor.assess_project(
+        # Score the selected options directly (no intermediate response dicts)
+        result = self.aia_processor.assess_project_options(
             project_name=project_name,
             project_description=project_description,
-            responses=converted_responses
+            responses=responses
         )
         
         # Add workflow guidance to the result
@@ -977,8 +1106,8 @@ class MCPServer:
         return self.aia_analyzer._get_impact_level_roman(impact_level)
 
     def _get_design_phase_questions(self) -> List[Dict[str, Any]]:
-        """Get design phase questions - delegates to AIAAnalyzer."""
-        return self.aia_analyzer._get_design_phase_questions()
+        """Get design phase questions - the AIAAnalyzer filters them once at load."""
+        return self.aia_analyzer._design_phase_questions
 
     def _get_questions(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get questions - delegates to AIAAnalyzer."""
@@ -1225,7 +1354,7 @@ class MCPServer:
         project_description = arguments.get("projectDescription", "")
         extracted_factors = arguments.get("extracted_factors")  # Phase 2: validated JSON from Claude
 
-        logger.info(f"OSFI E-23 model risk assessment for: {project_name}")
+        logger.info("OSFI E-23 model risk assessment for: %s", project_name)
 
         # Validate project description adequacy (NON-BLOCKING - results included as warnings)
         validation_result = self.description_validator.validate_description(project_description)
@@ -1263,7 +1392,7 @@ class MCPServer:
         )
         from model_type_classification import generate_model_type_evidence_prompt
 
-        logger.info(f"Phase 1: Generating extraction prompt for: {project_name}")
+        logger.info("Phase 1: Generating extraction prompt for: %s", project_name)
 
         # Get the structured extraction prompt
         extraction_data = get_extraction_prompt_for_description(project_description)
@@ -1347,7 +1476,7 @@ class MCPServer:
         from osfi_e23_risk_dimensions import get_dimension, get_total_factor_count
         import osfi_e23_workflow as workflow
 
-        logger.info(f"Phase 2: Running five-step Capability Evidence Workflow for: {project_name}")
+        logger.info("Phase 2: Running five-step Capability Evidence Workflow for: %s", project_name)
 
         model_type_evidence = validate_model_type_evidence(
             extracted_factors.get("model_type_evidence")
@@ -1507,6 +1636,9 @@ class MCPServer:
 
     def _export_e23_report(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Export OSFI E-23 assessment results to a Microsoft Word document."""
+        from utils.docx_template import new_document
+        from osfi_e23_report_generators import generate_osfi_e23_report
+
         project_name = arguments.get("project_name", "")
         project_description = arguments.get("project_description", "")
         assessment_results = arguments.get("assessment_results", {})
@@ -1517,7 +1649,7 @@ class MCPServer:
         include_conditional_modules_section = arguments.get("include_conditional_modules_section", True)
         include_governance_matrix = arguments.get("include_governance_matrix", True)
 
-        logger.info(f"Exporting OSFI E-23 report for project: {project_name}")
+        logger.info("Exporting OSFI E-23 report for project: %s", project_name)
 
         # CRITICAL FIX: Validate that assessment_results contains required data
         # Prevent generating misleading reports with default/incomplete values
@@ -1550,7 +1682,7 @@ class MCPServer:
 
         try:
             # Create OSFI_E23_Assessments directory if it doesn't exist
-            assessments_dir = "./OSFI_E23_Assessments"
+            assessments_dir = os.path.join(self._base_dir, "OSFI_E23_Assessments")
             os.makedirs(assessments_dir, exist_ok=True)
 
             # Generate filename
@@ -1559,14 +1691,14 @@ class MCPServer:
                 filename = f"{custom_filename}.docx"
             else:
                 # Clean project name for filename
-                clean_project_name = "".join(c for c in project_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+                clean_project_name = _FILENAME_UNSAFE_CHARS.sub('', project_name).rstrip()
                 clean_project_name = clean_project_name.replace(' ', '_')
                 filename = f"OSFI_E23_Report_{clean_project_name}_{current_date}.docx"
 
             file_path = os.path.join(assessments_dir, filename)
 
-            # Create Word document
-            doc = Document()
+            # Create Word document from the cached blank template
+            doc = new_document()
 
             # Get session ID for stage management
             session_id = self._get_or_create_auto_session(project_name, "osfi_e23")
@@ -1578,16 +1710,19 @@ class MCPServer:
             # Generate the OSFI E-23 report using v3.0 Risk Dimensions framework
             # Report uses assessment_results for dimensions and LIFECYCLE_REQUIREMENTS_BY_RISK for checklists
 
-            # DIAGNOSTIC: Log what's being passed to report generator
-            logger.info(f"Report generator receiving assessment_results keys: {list(assessment_results.keys())}")
-            factor_scores = assessment_results.get("factor_scores", {})
-            logger.info(f"factor_scores type: {type(factor_scores)}, keys: {list(factor_scores.keys()) if isinstance(factor_scores, dict) else 'N/A'}")
-            if factor_scores:
-                first_dim = list(factor_scores.keys())[0] if factor_scores else None
-                if first_dim:
-                    logger.info(f"factor_scores[{first_dim}] has {len(factor_scores[first_dim])} items")
-                    if factor_scores[first_dim]:
-                        logger.info(f"Sample factor: {factor_scores[first_dim][0]}")
+            # DIAGNOSTIC: Log what's being passed to report generator (DEBUG=1 only -
+            # the sample factor can be large)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Report generator receiving assessment_results keys: %s", list(assessment_results.keys()))
+                factor_scores = assessment_results.get("factor_scores", {})
+                logger.debug("factor_scores type: %s, keys: %s", type(factor_scores),
+                             list(factor_scores.keys()) if isinstance(factor_scores, dict) else 'N/A')
+                if factor_scores:
+                    first_dim = list(factor_scores.keys())[0] if factor_scores else None
+                    if first_dim:
+                        logger.debug("factor_scores[%s] has %s items", first_dim, len(factor_scores[first_dim]))
+                        if factor_scores[first_dim]:
+                            logger.debug("Sample factor: %s", factor_scores[first_dim][0])
 
             doc = generate_osfi_e23_report(
                 project_name=project_name,
@@ -1601,11 +1736,16 @@ class MCPServer:
                 include_governance_matrix=include_governance_matrix
             )
 
-            # Save document
-            doc.save(file_path)
+            # Save document - serialized in memory first so the size comes from the
+            # bytes written instead of a stat of the saved file
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            document_bytes = buffer.getvalue()
+            with open(file_path, 'wb') as f:
+                f.write(document_bytes)
 
             # Get file size
-            file_size = os.path.getsize(file_path)
+            file_size = len(document_bytes)
             file_size_kb = round(file_size / 1024, 1)
 
             # Extract risk level and stage for response
@@ -1660,65 +1800,346 @@ class MCPServer:
                 "file_path": None
             }
 
+    def _handle_batch(self, requests: List[Any]) -> Any:
+        """
+        Handle a JSON-RPC batch request.
+
+        Each entry goes through handle_request and the responses are returned
+        as one list, so the whole batch is written with a single write. A
+        batch containing only notifications gets no response.
+        """
+        invalid_request = {"jsonrpc": "2.0", "id": None, "error": _INVALID_REQUEST_ERROR}
+        if not requests:
+            return invalid_request
+
+        responses = []
+        for request in requests:
+            response = self.handle_request(request) if isinstance(request, dict) else invalid_request
+            if response is not None:
+                responses.append(response)
+        return responses or None
+
+    def _read_message(self) -> Optional[bytes]:
+        """
+        Read one JSON-RPC message body from stdin.
+
+        Messages are newline-delimited by default. With MCP_FRAMING=lsp the
+        body is preceded by LSP-style headers and exactly Content-Length bytes
+        are read. With MCP_FRAMING=msgpack the body is MessagePack preceded by
+        a 4-byte big-endian length. Returns None at end of input.
+        """
+        if self._framing == "msgpack":
+            header = self._in.read(4)
+            if len(header) < 4:
+                return None
+            # A truncated body surfaces as a parse error
+            return self._in.read(int.from_bytes(header, "big"))
+        if self._framing != "lsp":
+            return self._in.readline() or None
+
+        content_length = None
+        while True:
+            header = self._in.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.partition(b":")
+            if name.strip().lower() == b"content-length":
+                try:
+                    content_length = int(value.strip())
+                except ValueError:
+                    content_length = None
+
+        if content_length is None:
+            # Missing or malformed header - an empty body surfaces as a parse error
+            return b""
+        return self._in.read(content_length)
+
+    def _write_message(self, message: Any):
+        """Serialize and frame a JSON-RPC message and queue it for the writer thread."""
+        if self._framing == "msgpack":
+            payload = _encode_message_msgpack(message)
+            self._out_queue.put(len(payload).to_bytes(4, "big") + payload)
+            return
+        payload = _encode_message(message)
+        if self._framing == "lsp":
+            self._out_queue.put(b"Content-Length: %d\r\n\r\n" % len(payload) + payload)
+        else:
+            self._out_queue.put(payload + b"\n")
+
+    def _writer_loop(self):
+        """
+        Write queued frames to stdout in order until the shutdown sentinel arrives.
+
+        Frames that are already queued are written back to back and flushed
+        once, so a burst of responses costs one flush instead of one each.
+        """
+        out_queue = self._out_queue
+        while True:
+            frame = out_queue.get()
+            if frame is None:
+                break
+            stop = False
+            try:
+                while True:
+                    self._out.write(frame)
+                    try:
+                        frame = out_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if frame is None:
+                        stop = True
+                        break
+                self._out.flush()
+            except (OSError, ValueError) as e:
+                # Client closed stdout - keep draining so the reader never blocks on a full queue
+                logger.error(f"Error writing response: {str(e)}")
+            if stop:
+                break
+
+    def _start_writer(self):
+        """Start the background stdout writer with a bounded queue."""
+        self._out_queue = queue.Queue(maxsize=1024)
+        self._writer = threading.Thread(target=self._writer_loop, name="mcp-stdout-writer", daemon=True)
+        self._writer.start()
+
+    def _stop_writer(self):
+        """Flush the remaining queued frames and stop the writer thread."""
+        self._out_queue.put(None)
+        self._writer.join()
+
+    def _dispatch(self, request: Any) -> Any:
+        """Handle one parsed message (single request or batch) on a worker thread."""
+        if isinstance(request, list):
+            return self._handle_batch(request)
+        if not isinstance(request, dict):
+            # Valid JSON that is not a request object - same answer as inside a batch
+            return {"jsonrpc": "2.0", "id": None, "error": _INVALID_REQUEST_ERROR}
+        return self.handle_request(request)
+
+    def _submit(self, request: Any):
+        """Hand a parsed message to the worker pool, keeping its place in the response order."""
+        self._pending.put(self._pool.submit(self._dispatch, request))
+
+    def _submit_response(self, response: Dict[str, Any]):
+        """Queue a response produced on the reader thread behind any in-flight requests."""
+        future = Future()
+        future.set_result(response)
+        self._pending.put(future)
+
+    def _completion_loop(self):
+        """Wait on pending requests in arrival order and pass their responses to the writer."""
+        while True:
+            future = self._pending.get()
+            if future is None:
+                break
+            try:
+                response = future.result()
+            except Exception as e:
+                # handle_request reports its own errors - this only guards the loop
+                logger.error("Error completing request: %s", e)
+                continue
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Generated response: %s", response)
+
+            # Only send response if it's not None (notifications return None)
+            if response is not None:
+                self._write_message(response)
+                if debug:
+                    logger.debug("Response queued")
+            elif debug:
+                logger.debug("No response needed (notification)")
+
+    def _start_workers(self):
+        """Start the request worker pool and the in-order completion thread."""
+        self._pool = ThreadPoolExecutor(max_workers=REQUEST_WORKERS, thread_name_prefix="mcp-worker")
+        self._pending = queue.Queue(maxsize=1024)
+        self._completer = threading.Thread(target=self._completion_loop, name="mcp-completion", daemon=True)
+        self._completer.start()
+
+    def _stop_workers(self):
+        """Finish in-flight requests and hand their responses to the writer."""
+        self._pending.put(None)
+        self._completer.join()
+        self._pool.shutdown(wait=True)
+
+    def _process_message(self, line: bytes):
+        """Parse one message read from stdin and queue it for handling."""
+        # One level check per message instead of one per trace line
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Received line: %r", line)
+        
+        try:
+            request = _MSGPACK_DECODER.decode(line) if self._framing == "msgpack" else _json_loads(line)
+            if debug:
+                logger.debug("Parsed request: %s", request)
+            if isinstance(request, dict) and request.get("method") == "notifications/initialized":
+                # Sent once per session and needs no response - skip dispatch entirely
+                return
+            self._submit(request)
+            if debug:
+                logger.debug("Continuing to wait for next request...")
+            
+        except _MESSAGE_DECODE_ERRORS as e:
+            logger.debug("Message decode error: %s", e)
+            logger.error(f"Invalid message received: {e}")
+            self._submit_response(self._parse_error_response())
+
+    @staticmethod
+    def _parse_error_response() -> Dict[str, Any]:
+        """JSON-RPC parse error response for input that is not valid JSON."""
+        return {"jsonrpc": "2.0", "id": None, "error": _PARSE_ERROR}
+
+    def _pump_stdin(self):
+        """Read messages from stdin with blocking reads until end of input."""
+        while True:
+            # Read JSON-RPC request from stdin
+            logger.debug("Waiting for input...")
+            # Read raw bytes - the parser handles UTF-8 and surrounding
+            # whitespace itself, so no decode/strip round-trip is needed
+            line = self._read_message()
+            if line is None:
+                logger.debug("No input received, breaking")
+                break
+            self._process_message(line)
+
+    async def _read_message_async(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """Async counterpart of _read_message over an asyncio StreamReader."""
+        if self._framing == "msgpack":
+            try:
+                header = await reader.readexactly(4)
+            except asyncio.IncompleteReadError:
+                return None
+            try:
+                return await reader.readexactly(int.from_bytes(header, "big"))
+            except asyncio.IncompleteReadError as e:
+                return e.partial
+        if self._framing != "lsp":
+            return await reader.readline() or None
+
+        content_length = None
+        while True:
+            header = await reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.partition(b":")
+            if name.strip().lower() == b"content-length":
+                try:
+                    content_length = int(value.strip())
+                except ValueError:
+                    content_length = None
+
+        if content_length is None:
+            # Missing or malformed header - an empty body surfaces as a parse error
+            return b""
+        try:
+            return await reader.readexactly(content_length)
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+
+    async def _pump_stdin_async(self) -> bool:
+        """
+        Read messages from stdin on an asyncio event loop (MCP_IO=asyncio).
+
+        Handling and writing stay on the worker pool and writer thread.
+        Returns False without reading anything when stdin cannot be
+        registered with the event loop (e.g. a regular file), so the caller
+        can fall back to blocking reads.
+        """
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=ASYNC_READ_LIMIT)
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), self._in)
+        except ValueError as e:
+            logger.info("asyncio stdin reader unavailable (%s), using blocking reads", e)
+            return False
+
+        while True:
+            logger.debug("Waiting for input...")
+            try:
+                line = await self._read_message_async(reader)
+            except ValueError as e:
+                # Message longer than ASYNC_READ_LIMIT - the reader drops it
+                logger.error(f"Message too large: {e}")
+                self._submit_response(self._parse_error_response())
+                continue
+            if line is None:
+                logger.debug("No input received, breaking")
+                break
+            self._process_message(line)
+        return True
+
     def run(self):
         """Run the MCP server."""
-        print("DEBUG: Starting AIA Assessment MCP Server...", file=sys.stderr)
         logger.info("Starting AIA Assessment MCP Server (processors load on first tool call)...")
 
-        print("DEBUG: Server initialized, waiting for requests...", file=sys.stderr)
+        # Binary stdio handles - messages are parsed and serialized as bytes
+        stdin_raw = getattr(sys.stdin.buffer, "raw", None)
+        self._in = io.BufferedReader(stdin_raw, buffer_size=STDIN_BUFFER_SIZE) if stdin_raw is not None else sys.stdin.buffer
+        self._out = sys.stdout.buffer
+        self._framing = os.environ.get("MCP_FRAMING", "").lower()
+        if self._framing == "msgpack" and not MSGSPEC_AVAILABLE:
+            logger.warning("MCP_FRAMING=msgpack needs msgspec (pip install msgspec), using newline-delimited JSON")
+            self._framing = ""
+
+        # Responses are written by a background thread so the next request
+        # can be read and handled while the previous response drains
+        self._start_writer()
+        # Requests are handled on a worker pool; responses still go out in
+        # arrival order
+        self._start_workers()
+
+        logger.debug("Server initialized, waiting for requests...")
         
         try:
-            while True:
-                # Read JSON-RPC request from stdin
-                print("DEBUG: Waiting for input...", file=sys.stderr)
-                line = sys.stdin.readline()
-                if not line:
-                    print("DEBUG: No input received, breaking", file=sys.stderr)
-                    break
-                
-                print(f"DEBUG: Received line: {line.strip()}", file=sys.stderr)
-                
-                try:
-                    request = json.loads(line.strip())
-                    print(f"DEBUG: Parsed request: {request}", file=sys.stderr)
-                    response = self.handle_request(request)
-                    print(f"DEBUG: Generated response: {response}", file=sys.stderr)
-                    
-                    # Only send response if it's not None (notifications return None)
-                    if response is not None:
-                        print(json.dumps(response), flush=True)
-                        print("DEBUG: Response sent", file=sys.stderr)
-                    else:
-                        print("DEBUG: No response needed (notification)", file=sys.stderr)
-                    print("DEBUG: Continuing to wait for next request...", file=sys.stderr)
-                    
-                except json.JSONDecodeError as e:
-                    print(f"DEBUG: JSON decode error: {e}", file=sys.stderr)
-                    logger.error(f"Invalid JSON received: {e}")
-                    error_response = {
-                        "jsonrpc": "2.0",
-                        "id": None,
-                        "error": {
-                            "code": -32700,
-                            "message": "Parse error"
-                        }
-                    }
-                    print(json.dumps(error_response), flush=True)
+            if STDIO_PUMP != "asyncio" or not asyncio.run(self._pump_stdin_async()):
+                self._pump_stdin()
                     
         except KeyboardInterrupt:
-            print("DEBUG: KeyboardInterrupt received", file=sys.stderr)
+            logger.debug("KeyboardInterrupt received")
             logger.info("Server shutdown requested")
         except Exception as e:
-            print(f"DEBUG: Server error: {str(e)}", file=sys.stderr)
-            import traceback
-            print(f"DEBUG: Traceback: {traceback.format_exc()}", file=sys.stderr)
-            logger.error(f"Server error: {str(e)}")
+            logger.debug("Server error: %s", e, exc_info=True)
+            logger.error("Server error: %s", e)
             sys.exit(1)
+        finally:
+            self._stop_workers()
+            self._stop_writer()
+
+def _start_background_logging() -> QueueListener:
+    """
+    Move log output off the request thread.
+
+    The root logger's handlers are replaced by a QueueHandler and a
+    QueueListener thread writes the queued records to stderr, so request
+    handling never blocks on stderr writes.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
 
 def main():
     """Main function to run the MCP server."""
-    server = MCPServer()
-    server.run()
+    listener = _start_background_logging()
+    try:
+        server = MCPServer()
+        server.run()
+    finally:
+        listener.stop()
 
 if __name__ == "__main__":
     main()
@@ -94,5 +94,57 @@ def test_processor_methods():
     print(f"\n✅ All processor methods working correctly!")
     print(f"🎉 The AIAProcessor is ready for AI integration!")
 
+def test_convert_responses():
+    """Test conversion of MCP selectedOption indices to choice values."""
+    processor = AIAProcessor()
+    question = processor.scorable_questions[0]
+    choices = processor.choice_values[question['name']]
+
+    converted = processor.convert_responses([
+        {'questionId': question['name'], 'selectedOption': len(choices) - 1},
+        {'questionId': question['name'], 'selectedOption': len(choices)},
+        {'questionId': 'unknownQuestion', 'selectedOption': 2}
+    ])
+
+    assert converted == [
+        {'question_id': question['name'], 'selected_values': [choices[-1]]},
+        # Out-of-range index falls back to the first choice
+        {'question_id': question['name'], 'selected_values': [choices[0]]},
+        {'question_id': 'unknownQuestion', 'selected_values': ['item3-0']}
+    ]
+    print(f"✅ convert_responses handled {len(converted)} responses")
+
+def test_assess_project_options():
+    """Test that scoring selected options directly matches the converted-response path."""
+    processor = AIAProcessor()
+    responses = [
+        {'questionId': q['name'], 'selectedOption': i % len(q['choices'])}
+        for i, q in enumerate(processor.scorable_questions) if q.get('choices')
+    ]
+    responses.append({'questionId': 'unknownQuestion', 'selectedOption': 1})
+
+    direct = processor.assess_project_options("Test", "Description", responses)
+    converted = processor.assess_project("Test", "Description", processor.convert_responses(responses))
+
+    for key in ('total_score', 'raw_impact_score', 'mitigation_score', 'impact_level', 'responses_count', 'status'):
+        assert direct[key] == converted[key], key
+    assert processor.assess_project_options("Test", "Description", [])['status'] == 'questions_required'
+    print(f"✅ assess_project_options scored {direct['responses_count']} responses: {direct['total_score']}")
+
+def test_assessment_report_unhashable_value():
+    """Test that an unhashable selected value is reported as Unknown, not an error."""
+    processor = AIAProcessor()
+    question = processor.scorable_questions[0]
+    responses = [{'question_id': question['name'], 'selected_values': [['not', 'hashable']]}]
+    ai_responses = [{'question_id': question['name'], 'confidence': 0.9}]
+
+    report = processor.generate_assessment_report("Test", "Description", responses, ai_responses)
+
+    assert report['auto_populated_answers'][0]['selected_answer'] == "Unknown"
+    print("✅ generate_assessment_report tolerated an unhashable selected value")
+
 if __name__ == "__main__":
     test_processor_methods()
+    test_convert_responses()
+    test_assess_project_options()
+    test_assessment_report_unhashable_value()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Test stdio message framing
+
+Runs the server as a subprocess and checks that JSON-RPC messages round-trip
+with both newline-delimited framing and MCP_FRAMING=lsp Content-Length framing.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SERVER_PATH = Path(__file__).resolve().parents[2] / "server.py"
+
+# Runs server.py with orjson blocked, so the stdlib JSON fallback is exercised
+# even where orjson is installed
+NO_ORJSON_BOOTSTRAP = (
+    "import runpy, sys; sys.modules['orjson'] = None; "
+    "sys.path.insert(0, sys.argv[1]); runpy.run_path(sys.argv[1] + '/server.py', run_name='__main__')"
+)
+
+PING = {"jsonrpc": "2.0", "id": 1, "method": "ping"}
+TOOLS_LIST = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def _run_server(payload: bytes, framing: str = "", workers: int = 0, io: str = "", cwd: str = None,
+                no_orjson: bool = False) -> bytes:
+    env = dict(os.environ)
+    if framing:
+        env["MCP_FRAMING"] = framing
+    if workers:
+        env["MCP_WORKERS"] = str(workers)
+    if io:
+        env["MCP_IO"] = io
+    if no_orjson:
+        command = [sys.executable, "-c", NO_ORJSON_BOOTSTRAP, str(SERVER_PATH.parent)]
+    else:
+        command = [sys.executable, str(SERVER_PATH)]
+    process = subprocess.run(
+        command,
+        input=payload,
+        capture_output=True,
+        env=env,
+        cwd=cwd,
+        timeout=30
+    )
+    return process.stdout
+
+
+def _lsp_frame(message: dict) -> bytes:
+    body = json.dumps(message).encode("utf-8")
+    return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+def _parse_lsp_frames(data: bytes) -> list:
+    messages = []
+    while data:
+        header, _, rest = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        messages.append(json.loads(rest[:length]))
+        data = rest[length:]
+    return messages
+
+
+def test_newline_framing():
+    """Each request line produces exactly one response line."""
+    payload = (json.dumps(PING) + "\n" + json.dumps(TOOLS_LIST) + "\n").encode("utf-8")
+    lines = [line for line in _run_server(payload).split(b"\n") if line.strip()]
+
+    responses = [json.loads(line) for line in lines]
+    assert [r["id"] for r in responses] == [1, 2]
+    assert responses[0]["result"] == {}
+    assert len(responses[1]["result"]["tools"]) > 0
+    print(f"✅ Newline framing returned {len(responses)} responses")
+
+
+def test_newline_framing_parse_error():
+    """Malformed JSON lines still yield a JSON-RPC parse error."""
+    payload = b"{not json\n" + json.dumps(PING).encode("utf-8") + b"\n"
+    lines = [line for line in _run_server(payload).split(b"\n") if line.strip()]
+
+    responses = [json.loads(line) for line in lines]
+    assert responses[0]["error"]["code"] == -32700
+    assert responses[1]["id"] == 1
+    print("✅ Parse error reported and server kept serving")
+
+
+def test_invalid_utf8_parse_error():
+    """Bytes that are not UTF-8 get a parse error instead of stopping the server."""
+    payload = b"\xff\xfe{bad\n" + json.dumps(PING).encode("utf-8") + b"\n"
+    # Both parsers: orjson (when installed) and the stdlib fallback
+    for no_orjson in (False, True):
+        lines = [line for line in _run_server(payload, no_orjson=no_orjson).split(b"\n") if line.strip()]
+
+        responses = [json.loads(line) for line in lines]
+        assert len(responses) == 2
+        assert responses[0]["error"]["code"] == -32700
+        assert responses[1]["id"] == 1
+    print("✅ Invalid UTF-8 reported as a parse error")
+
+
+def test_non_object_request():
+    """A JSON value that is not an object or array gets an Invalid Request error."""
+    payload = b"42\n" + json.dumps(PING).encode("utf-8") + b"\n"
+    lines = [line for line in _run_server(payload).split(b"\n") if line.strip()]
+
+    responses = [json.loads(line) for line in lines]
+    assert len(responses) == 2
+    assert responses[0]["id"] is None
+    assert responses[0]["error"]["code"] == -32600
+    assert responses[1]["id"] == 1
+    print("✅ Non-object request reported as Invalid Request")
+
+
+def test_batch_request():
+    """A JSON-RPC batch gets one array response; notifications are skipped."""
+    batch = [PING, {"jsonrpc": "2.0", "method": "notifications/initialized"}, TOOLS_LIST, 42]
+    payload = (json.dumps(batch) + "\n" + json.dumps([{"jsonrpc": "2.0", "method": "notifications/initialized"}]) + "\n").encode("utf-8")
+    lines = [line for line in _run_server(payload).split(b"\n") if line.strip()]
+
+    assert len(lines) == 1
+    responses = json.loads(lines[0])
+    assert [r["id"] for r in responses] == [1, 2, None]
+    assert responses[2]["error"]["code"] == -32600
+    print(f"✅ Batch request returned {len(responses)} responses in one line")
+
+
+def test_lsp_framing():
+    """MCP_FRAMING=lsp reads and writes Content-Length framed messages."""
+    payload = _lsp_frame(PING) + _lsp_frame(TOOLS_LIST)
+    responses = _parse_lsp_frames(_run_server(payload, framing="lsp"))
+
+    assert [r["id"] for r in responses] == [1, 2]
+    assert len(responses[1]["result"]["tools"]) > 0
+    print(f"✅ LSP framing returned {len(responses)} responses")
+
+
+def test_msgpack_framing():
+    """MCP_FRAMING=msgpack reads and writes 4-byte length-prefixed MessagePack."""
+    try:
+        import msgspec
+    except ImportError:
+        if "pytest" in sys.modules:
+            # Report a skip, not a pass, when msgspec is missing
+            import pytest
+            pytest.skip("msgspec not installed")
+        print("⏭️  msgspec not installed, skipping MessagePack framing")
+        return
+
+    def frame(message: dict) -> bytes:
+        body = msgspec.msgpack.encode(message)
+        return len(body).to_bytes(4, "big") + body
+
+    output = _run_server(frame(PING) + frame(TOOLS_LIST), framing="msgpack")
+    responses = []
+    while output:
+        length = int.from_bytes(output[:4], "big")
+        responses.append(msgspec.msgpack.decode(output[4:4 + length]))
+        output = output[4 + length:]
+
+    assert [r["id"] for r in responses] == [1, 2]
+    assert len(responses[1]["result"]["tools"]) > 0
+    print(f"✅ MessagePack framing returned {len(responses)} responses")
+
+
+def test_worker_pool_preserves_order():
+    """With several workers, responses still come back in request order."""
+    requests = []
+    for i in range(1, 13):
+        if i % 3 == 0:
+            requests.append({"jsonrpc": "2.0", "id": i, "method": "tools/call",
+                             "params": {"name": "get_questions", "arguments": {}}})
+        else:
+            requests.append({"jsonrpc": "2.0", "id": i, "method": "ping" if i % 2 else "tools/list"})
+    payload = "".join(json.dumps(r) + "\n" for r in requests).encode("utf-8")
+    payload += b"{not json\n"
+    lines = [line for line in _run_server(payload, workers=4).split(b"\n") if line.strip()]
+
+    responses = [json.loads(line) for line in lines]
+    assert [r["id"] for r in responses] == list(range(1, 13)) + [None]
+    assert responses[-1]["error"]["code"] == -32700
+    print(f"✅ Worker pool returned {len(responses)} responses in order")
+
+
+def test_asyncio_reader():
+    """MCP_IO=asyncio reads both framings from a stdin pipe."""
+    payload = (json.dumps(PING) + "\n{not json\n" + json.dumps(TOOLS_LIST) + "\n").encode("utf-8")
+    lines = [line for line in _run_server(payload, io="asyncio").split(b"\n") if line.strip()]
+    responses = [json.loads(line) for line in lines]
+    assert [r["id"] for r in responses] == [1, None, 2]
+    assert responses[1]["error"]["code"] == -32700
+
+    payload = _lsp_frame(PING) + _lsp_frame(TOOLS_LIST)
+    responses = _parse_lsp_frames(_run_server(payload, framing="lsp", io="asyncio"))
+    assert [r["id"] for r in responses] == [1, 2]
+    print("✅ asyncio reader handled newline and LSP framing")
+
+
+def test_server_independent_of_cwd(tmp_path):
+    """Data files resolve against the server's directory, not the launch CWD."""
+    cwd = str(tmp_path)
+    call = {"jsonrpc": "2.0", "id": 3, "method": "tools/call",
+            "params": {"name": "get_questions", "arguments": {}}}
+    lines = [line for line in _run_server((json.dumps(call) + "\n").encode("utf-8"), cwd=cwd).split(b"\n") if line.strip()]
+
+    result = json.loads(json.loads(lines[0])["result"]["content"][0]["text"])
+    assert result["total_available"] > 0
+    assert os.listdir(cwd) == []
+    print(f"✅ Server loaded {result['total_available']} questions from an unrelated CWD")
+
+
+if __name__ == "__main__":
+    test_newline_framing()
+    test_newline_framing_parse_error()
+    test_invalid_utf8_parse_error()
+    test_non_object_request()
+    test_batch_request()
+    test_lsp_framing()
+    test_msgpack_framing()
+    test_worker_pool_preserves_order()
+    test_asyncio_reader()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_server_independent_of_cwd(tmp_dir)
@@ -8,14 +8,44 @@ This module contains helper methods for extracting, formatting, and processing
 assessment data for report generation.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from docx import Document
 from docx.shared import Pt, RGBColor
 import logging
 
+from utils.term_scanner import build_term_scanner, scan_terms
+
 logger = logging.getLogger(__name__)
 
+# Impact level number -> Roman numeral
+_ROMAN_NUMERALS = {1: 'I', 2: 'II', 3: 'III', 4: 'IV'}
+
+# Top-level assessment result fields holding the score / impact level, in
+# priority order; partialAssessment nests its own currentScore / impactLevel
+_SCORE_FIELDS = ('functional_risk_score', 'partialAssessment', 'currentScore', 'rawImpactScore')
+_IMPACT_LEVEL_FIELDS = ('likely_impact_level', 'partialAssessment', 'impactLevel')
+
+# AIA key findings and the description terms behind them (substring match on
+# the lowercased description), scanned in one pass
+_AIA_KEY_FINDING_TERMS = {
+    "System uses AI/ML algorithms requiring interpretability considerations": ('ai', 'machine learning', 'algorithm'),
+    "System processes personal information requiring privacy safeguards": ('personal', 'sensitive', 'private', 'pii'),
+    "Automated decision-making requires human oversight mechanisms": ('automated', 'without human review'),
+    "Financial decisions have significant economic impact on individuals": ('financial', 'economic', 'loan', 'credit'),
+    "High-volume processing requires robust monitoring systems": ('thousands', 'daily', 'real-time', 'high volume')
+}
+_AIA_KEY_FINDING_SCANNER = build_term_scanner(_AIA_KEY_FINDING_TERMS)
+
+# E-23 business rationales in priority order; the first matching one is used
+_E23_BUSINESS_RATIONALE_TERMS = {
+    "This model supports risk management objectives by providing quantitative risk assessments to inform business decisions and regulatory compliance requirements.": ('risk management', 'credit risk', 'market risk'),
+    "This model enhances fraud detection capabilities to protect the institution and customers from financial losses while maintaining operational efficiency.": ('fraud', 'detection', 'prevention'),
+    "This model supports pricing and credit decision-making to optimize risk-adjusted returns while ensuring fair and consistent treatment of customers.": ('pricing', 'loan', 'credit'),
+    "This model supports regulatory compliance and reporting requirements while improving operational efficiency and decision-making accuracy.": ('regulatory', 'compliance', 'reporting')
+}
+_E23_BUSINESS_RATIONALE_SCANNER = build_term_scanner(_E23_BUSINESS_RATIONALE_TERMS)
+
 
 class AIADataExtractor:
     """
@@ -41,17 +71,13 @@ class AIADataExtractor:
         mcp_official_data = assessment_results.get('mcp_official_data', {})
         if 'functional_risk_score' in mcp_official_data:
             return mcp_official_data['functional_risk_score']
-        # Try different possible score field names
-        if 'functional_risk_score' in assessment_results:
-            return assessment_results['functional_risk_score']
-        elif 'partialAssessment' in assessment_results:
-            return assessment_results['partialAssessment'].get('currentScore', 0)
-        elif 'currentScore' in assessment_results:
-            return assessment_results['currentScore']
-        elif 'rawImpactScore' in assessment_results:
-            return assessment_results['rawImpactScore']
-        else:
-            return 0
+        # Try different possible score field names, in priority order
+        for field in _SCORE_FIELDS:
+            if field in assessment_results:
+                if field == 'partialAssessment':
+                    return assessment_results['partialAssessment'].get('currentScore', 0)
+                return assessment_results[field]
+        return 0
 
     def extract_impact_level(self, assessment_results: Dict[str, Any]) -> str:
         """Extract impact level from assessment results."""
@@ -60,43 +86,30 @@ class AIADataExtractor:
         mcp_official_data = assessment_results.get('mcp_official_data', {})
         if 'likely_impact_level' in mcp_official_data:
             return mcp_official_data['likely_impact_level']
-        # Try different possible impact level field names
-        if 'likely_impact_level' in assessment_results:
-            return assessment_results['likely_impact_level']
-        elif 'partialAssessment' in assessment_results:
-            return assessment_results['partialAssessment'].get('impactLevel', 'Level I')
-        elif 'impactLevel' in assessment_results:
-            return assessment_results['impactLevel']
-        else:
-            score = self.extract_score(assessment_results)
-            level, _, _ = self.aia_processor.determine_impact_level(score)
-            return f"Level {self._get_impact_level_roman(level)}"
+        # Try different possible impact level field names, in priority order
+        for field in _IMPACT_LEVEL_FIELDS:
+            if field in assessment_results:
+                if field == 'partialAssessment':
+                    return assessment_results['partialAssessment'].get('impactLevel', 'Level I')
+                return assessment_results[field]
+        score = self.extract_score(assessment_results)
+        level, _, _ = self.aia_processor.determine_impact_level(score)
+        return f"Level {self._get_impact_level_roman(level)}"
 
     def _get_impact_level_roman(self, level: int) -> str:
         """Convert numeric impact level to Roman numeral."""
-        roman_map = {1: 'I', 2: 'II', 3: 'III', 4: 'IV'}
-        return roman_map.get(level, 'I')
+        return _ROMAN_NUMERALS.get(level, 'I')
 
-    def extract_key_findings(self, assessment_results: Dict[str, Any], project_description: str) -> List[str]:
+    def extract_key_findings(self, assessment_results: Dict[str, Any], project_description: str,
+                             description_lower: Optional[str] = None) -> List[str]:
         """Extract key findings from assessment results."""
         findings = []
-        description_lower = project_description.lower()
+        if description_lower is None:
+            description_lower = project_description.lower()
 
         # Add findings based on system characteristics
-        if any(term in description_lower for term in ['ai', 'machine learning', 'algorithm']):
-            findings.append("System uses AI/ML algorithms requiring interpretability considerations")
-
-        if any(term in description_lower for term in ['personal', 'sensitive', 'private', 'pii']):
-            findings.append("System processes personal information requiring privacy safeguards")
-
-        if any(term in description_lower for term in ['automated', 'without human review']):
-            findings.append("Automated decision-making requires human oversight mechanisms")
-
-        if any(term in description_lower for term in ['financial', 'economic', 'loan', 'credit']):
-            findings.append("Financial decisions have significant economic impact on individuals")
-
-        if any(term in description_lower for term in ['thousands', 'daily', 'real-time', 'high volume']):
-            findings.append("High-volume processing requires robust monitoring systems")
+        matched = scan_terms(description_lower, _AIA_KEY_FINDING_TERMS, _AIA_KEY_FINDING_SCANNER)
+        findings.extend(finding for finding, found in matched.items() if found)
 
         # Add findings from assessment results. functional_preview nests these
         # under "ai_generated_analysis" (see CLAUDE.md "Transparency and Data
@@ -153,15 +166,8 @@ class AIADataExtractor:
                 "Plan regular system performance reviews"
             ])
 
-        # Remove duplicates and limit
-        seen = set()
-        unique_recommendations = []
-        for rec in recommendations:
-            if rec not in seen:
-                seen.add(rec)
-                unique_recommendations.append(rec)
-
-        return unique_recommendations[:8]  # Limit to 8 recommendations
+        # Remove duplicates (keeping first occurrences in order) and limit
+        return list(dict.fromkeys(recommendations))[:8]  # Limit to 8 recommendations
 
     def extract_true_risk_factors(self, risk_analysis: Dict[str, Any]) -> List[str]:
         """Extract only TRUE risk factors from assessment."""
@@ -367,7 +373,7 @@ class OSFIE23DataExtractor:
         """Extract lifecycle compliance information from E-23 assessment results."""
         if 'compliance_checklist' in assessment_results:
             checklist = assessment_results['compliance_checklist']
-            completed_items = len([item for item in checklist if item.get('completed', False)])
+            completed_items = sum(1 for item in checklist if item.get('completed', False))
             total_items = len(checklist)
             return f"Compliance checklist: {completed_items}/{total_items} items completed. Review lifecycle requirements and ensure all mandatory items are addressed before model deployment."
 
@@ -382,16 +388,11 @@ class OSFIE23DataExtractor:
         description_lower = project_description.lower()
 
         # Generate business rationale based on project characteristics
-        if any(term in description_lower for term in ['risk management', 'credit risk', 'market risk']):
-            return "This model supports risk management objectives by providing quantitative risk assessments to inform business decisions and regulatory compliance requirements."
-        elif any(term in description_lower for term in ['fraud', 'detection', 'prevention']):
-            return "This model enhances fraud detection capabilities to protect the institution and customers from financial losses while maintaining operational efficiency."
-        elif any(term in description_lower for term in ['pricing', 'loan', 'credit']):
-            return "This model supports pricing and credit decision-making to optimize risk-adjusted returns while ensuring fair and consistent treatment of customers."
-        elif any(term in description_lower for term in ['regulatory', 'compliance', 'reporting']):
-            return "This model supports regulatory compliance and reporting requirements while improving operational efficiency and decision-making accuracy."
-        else:
-            return "This model supports business objectives by automating decision-making processes, improving operational efficiency, and enhancing risk management capabilities."
+        matched = scan_terms(description_lower, _E23_BUSINESS_RATIONALE_TERMS, _E23_BUSINESS_RATIONALE_SCANNER)
+        for rationale, found in matched.items():
+            if found:
+                return rationale
+        return "This model supports business objectives by automating decision-making processes, improving operational efficiency, and enhancing risk management capabilities."
 
     def extract_key_risk_factors(self, assessment_results: Dict[str, Any]) -> List[str]:
         """Extract key risk factors from assessment results."""
@@ -0,0 +1,25 @@
+"""
+DOCX Template Module
+
+Provides blank Word documents for report exports. python-docx's default
+template is read and serialized once per process; each export then opens its
+document from those in-memory bytes instead of loading the template from disk.
+"""
+
+import functools
+import io
+
+from docx import Document
+
+
+@functools.lru_cache(maxsize=None)
+def _blank_document_bytes() -> bytes:
+    """The default python-docx template, serialized once."""
+    buffer = io.BytesIO()
+    Document().save(buffer)
+    return buffer.getvalue()
+
+
+def new_document():
+    """Return a new blank Document, equivalent to docx.Document()."""
+    return Document(io.BytesIO(_blank_document_bytes()))
@@ -0,0 +1,86 @@
+"""
+Term Scanner Module
+
+Single-pass substring matching of many literal terms against a lowercased
+description. An indicator -> terms table is compiled once into a scanner, and
+each scan reports which indicators have at least one term in the text, so
+callers test many keyword groups with one pass instead of one scan per term.
+"""
+
+from typing import Dict
+import re
+
+# Optional: pyahocorasick matches every term in one pass of a C automaton;
+# without it the scanners fall back to a compiled regex
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
+
+def build_term_scanner(indicator_terms: Dict[str, tuple], indicator_bits: Dict[str, int] = None) -> tuple:
+    """
+    Compile an indicator -> terms table into a single-pass scanner.
+
+    With indicator_bits each term carries the OR of its indicators' bits
+    instead of their names, for scan_term_mask.
+
+    With pyahocorasick the scanner is an automaton reporting every term
+    occurrence, overlapping ones included. Otherwise the regex pattern
+    reports, at every position of the description, the longest term starting
+    there (alternatives are tried longest first inside a lookahead, so
+    overlapping terms are not skipped). Any other term matching at the same
+    position is a prefix of that one, so each term maps to the indicators of
+    itself and all of its prefixes.
+    """
+    terms = sorted({term for terms in indicator_terms.values() for term in terms}, key=len, reverse=True)
+    indicators_by_term = {
+        term: tuple(
+            indicator for indicator, prefixes in indicator_terms.items()
+            if any(term.startswith(prefix) for prefix in prefixes)
+        )
+        for term in terms
+    }
+    if indicator_bits is not None:
+        indicators_by_term = {
+            term: sum(indicator_bits[indicator] for indicator in indicators)
+            for term, indicators in indicators_by_term.items()
+        }
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for term, indicators in indicators_by_term.items():
+            automaton.add_word(term, indicators)
+        automaton.make_automaton()
+        return automaton, indicators_by_term
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, terms)) + "))")
+    return pattern, indicators_by_term
+
+
+def scan_terms(description_lower: str, indicator_terms: Dict[str, tuple], scanner: tuple) -> Dict[str, bool]:
+    """Flag every indicator with at least one term in the lowercased description."""
+    matcher, indicators_by_term = scanner
+    indicators = dict.fromkeys(indicator_terms, False)
+    if AHOCORASICK_AVAILABLE:
+        for _, term_indicators in matcher.iter(description_lower):
+            for indicator in term_indicators:
+                indicators[indicator] = True
+        return indicators
+    for match in matcher.finditer(description_lower):
+        for indicator in indicators_by_term[match.group(1)]:
+            indicators[indicator] = True
+    return indicators
+
+
+def scan_term_mask(description_lower: str, scanner: tuple) -> int:
+    """OR together the bits of every indicator with a term in the lowercased description."""
+    matcher, bits_by_term = scanner
+    mask = 0
+    if AHOCORASICK_AVAILABLE:
+        for _, term_bits in matcher.iter(description_lower):
+            mask |= term_bits
+        return mask
+    for match in matcher.finditer(description_lower):
+        mask |= bits_by_term[match.group(1)]
+    return mask
@@ -99,14 +99,15 @@ class WorkflowEngine:
         if not assessment_type:
             assessment_type = self._detect_assessment_type(project_description)
 
+        created_at = datetime.now().isoformat()
         session = {
             "session_id": session_id,
             "project_name": project_name,
             "project_description": project_description,
             "assessment_type": assessment_type,
             "state": WorkflowState.CREATED.value,
-            "created_at": datetime.now().isoformat(),
-            "last_accessed": datetime.now().isoformat(),
+            "created_at": created_at,
+            "last_accessed": created_at,
             "completed_tools": [],
             "tool_results": {},
             "current_step": 0,
@@ -127,13 +128,14 @@ class WorkflowEngine:
 
         session = self.sessions[session_id]
         last_accessed = datetime.fromisoformat(session["last_accessed"])
+        now = datetime.now()
 
-        if datetime.now() - last_accessed > self.session_timeout:
+        if now - last_accessed > self.session_timeout:
             del self.sessions[session_id]
             return None
 
         # Update last accessed time
-        session["last_accessed"] = datetime.now().isoformat()
+        session["last_accessed"] = now.isoformat()
         return session
 
     def execute_tool(self, session_id: str, tool_name: str, tool_result: Dict[str, Any]) -> Dict[str, Any]: